@@ -5,17 +5,25 @@ Writes ONE CSV (aaai_all_papers_authors.csv) with columns:
 site,year,conference,track,paper_url,pdf_url,email,name,affiliation
 
 Major fixes:
- - Detect PDF responses via Content-Type or PDF signature and skip BeautifulSoup parsing for them.
- - Optional PDF email extraction with pdfminer.six (only if installed).
+ - Detect PDF responses via Content-Type or PDF signature and skip HTML parsing for them.
+ - Index, year and paper pages are parsed with lxml.html (C parser) instead of BeautifulSoup.
+ - Optional PDF email extraction with pypdfium2 or pdfminer.six (only if installed).
  - Graceful KeyboardInterrupt handling so CSV is preserved.
+ - Paper pages of a year are fetched concurrently by a small thread pool (MAX_WORKERS).
+ - Optional on-disk HTTP cache (requests-cache) plus a cache of extracted PDF text, so re-runs skip the network.
 """
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
-import re, csv, time, random, os, sys
+import lxml.html
+from lxml import etree
+import re, csv, time, random, os, sys, threading, shelve, atexit
+import multiprocessing
+from datetime import timedelta
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse, urlunparse
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 # Optional PDF parsing
 try:
@@ -25,6 +33,30 @@ try:
 except Exception:
     PDFMINER_AVAILABLE = False
 
+# PDFium bindings are much faster than pdfminer; preferred when installed
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except Exception:
+    PDFIUM_AVAILABLE = False
+
+PDF_TEXT_AVAILABLE = PDFIUM_AVAILABLE or PDFMINER_AVAILABLE
+
+# Optional persistent HTTP cache: published proceedings pages practically never change
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Optional linear-time regex engine for scanning page/PDF text for emails
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = re
+    RE2_AVAILABLE = False
+
 # ---------- CONFIG ----------
 START_URL = "https://www.aaai.org/Library/conferences-library.php"
 SITE_NAME = "AAAI"
@@ -37,10 +69,63 @@ BACKOFF = 0.5
 DELAY_BASE = 0.8
 MAX_PAPERS_PER_YEAR = None
 MAX_YEARS_PER_CONFERENCE = None
+MAX_WORKERS = 8  # concurrent paper fetches against the AAAI host
+PDF_WORKERS = os.cpu_count() or 1  # processes for CPU-bound PDF text extraction
+# Pool workers come from a forkserver (spawn where there is none): the pool adds workers on demand
+# while other threads are running, and forking while one of them holds a lock can deadlock the child
+PDF_POOL_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+HTTP_CACHE = "aaai_http_cache"  # requests-cache SQLite file for HTML pages
+CACHE_EXPIRE = timedelta(days=30)
+PDF_TEXT_CACHE = "aaai_pdf_text_cache"  # shelve of extracted PDF text keyed by URL
 # ----------------------------
 
+# Precompiled patterns used on every index/year/paper page
+EMAIL_RE = re2.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+WORD_RE = re.compile(r"[A-Za-z\-\']{2,}")
+YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+HREF_YEAR_RE = re.compile(r'(19\d{2}|20\d{2})')
+CITATION_AUTHOR_RE = re.compile(r'citation_author$', re.I)
+CITATION_EMAIL_RE = re.compile(r'citation_author_email$', re.I)
+CITATION_AFF_RE = re.compile(r'citation_author_institution$', re.I)
+
+# Link filters evaluated inside libxml2 (EXSLT regex extension); only the matching hrefs come back to Python
+REGEXP_NS = {'re': 'http://exslt.org/regular-expressions'}
+# Index page: conference blocks by class, else any div/section holding both a heading and a link
+CONF_BLOCK_XPATH = etree.XPath("//*[contains(concat(' ', normalize-space(@class), ' '), ' libraryconf ')]")
+CONF_BLOCK_FALLBACK_XPATH = etree.XPath("//*[self::div or self::section][.//h2 and .//a]")
+# String results use smart_strings=False: smart strings hold a reference to their whole parsed page,
+# which would otherwise stay alive as a normalize_url cache key
+# Cheap contains()/starts-with() tests come first; libxml2 short-circuits and/or, so the regexes
+# only run for links those tests didn't already decide (and the year regex only on text with a digit)
+LOWER_HREF_EXPR = "translate(normalize-space(@href), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+PAPER_HREFS_XPATH = etree.XPath(
+    f"//a[@href][contains({LOWER_HREF_EXPR}, '/paper') or contains({LOWER_HREF_EXPR}, '/article')"
+    f" or contains({LOWER_HREF_EXPR}, '.pdf') or re:test(@href, '/\\d{{4}}\\.')"
+    " or (translate(string(.), '0123456789', '') != string(.) and re:test(string(.), '20\\d{2}'))]"
+    f"[not(starts-with({LOWER_HREF_EXPR}, '#') or starts-with({LOWER_HREF_EXPR}, 'mailto:')"
+    f" or re:test({LOWER_HREF_EXPR}, '\\.(jpg|png)$'))]/@href",
+    namespaces=REGEXP_NS, smart_strings=False)
+PDF_META_XPATH = etree.XPath("(//meta[re:test(@name, 'citation_pdf_url', 'i')])[1]/@content[normalize-space()]",
+                             namespaces=REGEXP_NS, smart_strings=False)
+PDF_LINK_XPATH = etree.XPath("(//a[re:test(@href, '\\.pdf|download', 'i')])[1]/@href",
+                             namespaces=REGEXP_NS, smart_strings=False)
+PDF_HREFS_XPATH = etree.XPath("//a/@href[re:test(., '\\.pdf', 'i')]", namespaces=REGEXP_NS, smart_strings=False)
+# Fallback email scan: elements owning a text node with '@', plus up to 4 text nodes before each for name context
+EMAIL_HOLDER_XPATH = etree.XPath("//*[not(self::script or self::style)][text()[contains(., '@')]]")
+PRECEDING_TEXT_XPATH = etree.XPath("preceding::text()[not(ancestor::script or ancestor::style)][position() <= 4]",
+                                  smart_strings=False)
+
+def is_cacheable(resp):
+    # PDF bodies stay out of the HTTP cache; their extracted text is cached instead
+    return 'application/pdf' not in resp.headers.get('Content-Type', '').lower()
+
 def make_session():
-    s = requests.Session()
+    if REQUESTS_CACHE_AVAILABLE:
+        s = requests_cache.CachedSession(HTTP_CACHE, backend='sqlite', expire_after=CACHE_EXPIRE,
+                                         filter_fn=is_cacheable)
+    else:
+        s = requests.Session()
     retry = Retry(total=RETRIES, backoff_factor=BACKOFF,
                   status_forcelist=(429, 500, 502, 503, 504),
                   allowed_methods=frozenset(['GET', 'POST', 'HEAD']))
@@ -49,12 +134,16 @@ def make_session():
     s.headers.update({"User-Agent": USER_AGENT})
     return s
 
-def safe_get(session, url):
-    return session.get(url, timeout=REQUEST_TIMEOUT)
+def safe_get(session, url, stream=False):
+    return session.get(url, timeout=REQUEST_TIMEOUT, stream=stream)
 
+@lru_cache(maxsize=100_000)  # nav/sidebar hrefs repeat on every page
 def normalize_url(base, href):
     if not href:
         return None
+    if href.startswith(('http://', 'https://')):
+        # Already absolute: only the fragment has to go, no parse/unparse round-trip needed
+        return href.split('#', 1)[0]
     joined = urljoin(base, href)
     p = urlparse(joined)
     return urlunparse((p.scheme, p.netloc, p.path, p.params, p.query, ""))
@@ -62,19 +151,25 @@ def normalize_url(base, href):
 def jitter_sleep():
     time.sleep(DELAY_BASE + random.uniform(0, DELAY_BASE * 0.3))
 
-def extract_all_meta_values(soup, name_regex):
-    tags = soup.find_all('meta', attrs={'name': re.compile(name_regex, re.I)})
+# Paper and year pages are parsed with lxml.html directly; the helpers below take an lxml tree.
+def element_text(el):
+    # Same shape as BeautifulSoup's get_text(" ", strip=True); script/style contents are skipped
+    parts = (t.strip() for t in el.xpath('.//text()[not(ancestor::script or ancestor::style)]'))
+    return " ".join(t for t in parts if t)
+
+def extract_all_meta_values(tree, name_re):
     vals = []
-    for t in tags:
-        c = t.get('content', '').strip()
-        if c:
-            vals.append(c)
+    for t in tree.iter('meta'):
+        if name_re.search(t.get('name', '')):
+            c = (t.get('content') or '').strip()
+            if c:
+                vals.append(c)
     return vals
 
-def extract_authors_from_meta(soup):
-    names = extract_all_meta_values(soup, r'citation_author$')
-    emails = extract_all_meta_values(soup, r'citation_author_email$')
-    affs = extract_all_meta_values(soup, r'citation_author_institution$')
+def extract_authors_from_meta(tree):
+    names = extract_all_meta_values(tree, CITATION_AUTHOR_RE)
+    emails = extract_all_meta_values(tree, CITATION_EMAIL_RE)
+    affs = extract_all_meta_values(tree, CITATION_AFF_RE)
     authors = []
     for i, n in enumerate(names):
         a = {'name': n, 'email': None, 'affiliation': ''}
@@ -87,91 +182,120 @@ def extract_authors_from_meta(soup):
         authors.append(a)
     return authors
 
-def extract_mailto_links(soup):
+def extract_mailto_links(tree):
     out = []
-    for a in soup.select('a[href^=mailto]'):
+    for a in tree.xpath("//a[starts-with(@href, 'mailto')]"):
         href = a.get('href', '')
         email = href.split(':',1)[1].split('?')[0].strip() if ':' in href else ''
         if not email:
             continue
-        name = a.get_text(" ", strip=True) or ''
+        name = element_text(a)
         out.append({'email': email, 'name': name, 'affiliation': ''})
     return out
 
-def fallback_text_author_search(soup):
-    text = soup.get_text(" ", strip=True)
-    emails = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-    uniq = []
-    for e in emails:
-        if e not in uniq:
-            uniq.append(e)
+def guess_authors_from_text(text):
+    # Single pass: each email's first match carries its own position, so no text.find() rescans
+    seen = set()
     out = []
-    for e in uniq:
-        idx = text.find(e)
+    for m in EMAIL_RE.finditer(text):
+        e = m.group(0)
+        if e in seen:
+            continue
+        seen.add(e)
+        idx = m.start()
         name_guess = ''
         if idx > 0:
-            start = max(0, idx-120)
-            snippet = text[start:idx]
-            words = re.findall(r"[A-Za-z\-\']{2,}", snippet)
+            # Look for name-like words in the 120 chars before the email, without slicing
+            words = WORD_RE.findall(text, max(0, idx-120), idx)
             if words:
-                candidate = " ".join(words[-4:])
-                name_guess = candidate
+                name_guess = " ".join(words[-4:])
         out.append({'email': e, 'name': name_guess, 'affiliation': ''})
     return out
 
-def try_extract_from_pdf(session, pdf_url):
-    if not PDFMINER_AVAILABLE:
+def fallback_text_author_search(tree):
+    # Only elements with an '@' in their own text are visited, each scanned together with the few text
+    # nodes just before it (where the name usually sits) instead of materialising the whole page text
+    seen = set()
+    out = []
+    for el in EMAIL_HOLDER_XPATH(tree):
+        context = [t.strip() for t in PRECEDING_TEXT_XPATH(el)]
+        context.append(element_text(el))
+        for a in guess_authors_from_text(" ".join(t for t in context if t)):
+            if a['email'] not in seen:
+                seen.add(a['email'])
+                out.append(a)
+    return out
+
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+def get_pdf_pool():
+    # Created on first use (from any paper worker) so importing this module spawns nothing
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=PDF_POOL_CONTEXT)
+        return _pdf_pool
+
+_pdf_text_cache = None
+_pdf_text_lock = threading.Lock()
+
+def pdf_text_cache():
+    # Opened on first use; callers hold _pdf_text_lock
+    global _pdf_text_cache
+    if _pdf_text_cache is None:
+        _pdf_text_cache = shelve.open(PDF_TEXT_CACHE)
+        atexit.register(_pdf_text_cache.close)
+    return _pdf_text_cache
+
+def extract_text_from_bytes(data):
+    # Module-level so it can be pickled into the PDF worker processes
+    if PDFIUM_AVAILABLE:
+        try:
+            pdf = pdfium.PdfDocument(data)
+            try:
+                return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+            finally:
+                pdf.close()
+        except Exception:
+            # Fall back to pdfminer for documents PDFium rejects
+            if not PDFMINER_AVAILABLE:
+                raise
+    return extract_text(BytesIO(data))
+
+# Executed in a PDF worker process: the email/name heuristics run there too, not under the scraper's GIL
+def extract_pdf_authors(data):
+    text = extract_text_from_bytes(data)
+    return text, guess_authors_from_text(text)
+
+# resp: optional already-open (streamed) response for pdf_url; its body is only read on a text-cache miss,
+# so a PDF served straight from the paper URL is downloaded once instead of twice
+def try_extract_from_pdf(session, pdf_url, resp=None):
+    if not PDF_TEXT_AVAILABLE:
         return []
     try:
-        r = safe_get(session, pdf_url)
-        if r.status_code != 200:
-            return []
-        data = r.content
-        # Use pdfminer to extract text
-        text = extract_text(BytesIO(data))
-        emails = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-        uniq = []
-        out = []
-        for e in emails:
-            if e not in uniq:
-                uniq.append(e)
-                idx = text.find(e)
-                name_guess = ''
-                if idx > 0:
-                    start = max(0, idx-120)
-                    snippet = text[start:idx]
-                    words = re.findall(r"[A-Za-z\-\']{2,}", snippet)
-                    if words:
-                        name_guess = " ".join(words[-4:])
-                out.append({'email': e, 'name': name_guess, 'affiliation': ''})
-        return out
+        with _pdf_text_lock:
+            text = pdf_text_cache().get(pdf_url)
+        if text is None:
+            r = resp if resp is not None else safe_get(session, pdf_url)
+            if r.status_code != 200:
+                return []
+            data = r.content
+            # Extract text (PDFium, else pdfminer) and guess authors off the paper worker thread
+            text, authors = get_pdf_pool().submit(extract_pdf_authors, data).result()
+            with _pdf_text_lock:
+                pdf_text_cache()[pdf_url] = text
+            return authors
+        return guess_authors_from_text(text)
     except Exception:
         return []
 
-def extract_pdf_url_from_page(soup, base_url):
-    meta = soup.find('meta', attrs={'name': re.compile(r'citation_pdf_url', re.I)})
-    if meta and meta.get('content'):
-        return normalize_url(base_url, meta['content'])
-    for a in soup.find_all('a', href=True):
-        href = a['href']
-        if '.pdf' in href.lower() or 'download' in href.lower():
-            return normalize_url(base_url, href)
-    return None
-
-def find_candidate_paper_links(soup, base_url):
-    candidates = []
-    for a in soup.find_all('a', href=True):
-        href = a['href'].strip()
-        lower = href.lower()
-        if lower.startswith('#') or lower.startswith('mailto:') or lower.endswith('.jpg') or lower.endswith('.png'):
-            continue
-        if any(k in lower for k in ['/paper', '/paper/', '/papers/', '/article', '/article/view', '.pdf']) or re.search(r'/\d{4}\.', lower) or re.search(r'20\d{2}', a.get_text() or ''):
-            candidates.append(normalize_url(base_url, href))
-    seen = set(); out = []
-    for u in candidates:
-        if u and u not in seen:
-            seen.add(u); out.append(u)
-    return out
+def extract_pdf_url_from_page(tree, base_url):
+    href = next(iter(PDF_META_XPATH(tree) or PDF_LINK_XPATH(tree)), None)
+    return normalize_url(base_url, href) if href else None
+
+def find_candidate_paper_links(tree, base_url):
+    return list(dict.fromkeys(u for u in (normalize_url(base_url, href.strip()) for href in PAPER_HREFS_XPATH(tree)) if u))
 
 def is_pdf_response(resp):
     # Check content-type header first
@@ -179,6 +303,7 @@ def is_pdf_response(resp):
     if 'application/pdf' in ctype:
         return True
     # If header absent/misleading, check start bytes for %PDF signature
+    # (for a streamed response this reads the body, which HTML pages need anyway)
     start = resp.content[:5] if getattr(resp, 'content', None) else b''
     try:
         if isinstance(start, str):
@@ -195,10 +320,78 @@ def write_csv_header(path):
             writer = csv.writer(fh)
             writer.writerow(["site","year","conference","track","paper_url","pdf_url","email","name","affiliation"])
 
-def append_row(path, row):
-    with open(path, 'a', newline='', encoding='utf-8') as fh:
-        writer = csv.writer(fh)
-        writer.writerow(row)
+# Runs inside the paper worker pool; returns the CSV rows for one paper URL
+def scrape_paper(session, paper_url, p_idx, total, year, conf_title, track):
+    print(f"        [{p_idx}/{total}] Visiting {paper_url}")
+    try:
+        # Streamed so a PDF announced by Content-Type is never read here
+        rp = safe_get(session, paper_url, stream=True)
+    except Exception as e:
+        print(f"           Failed to GET: {e}")
+        return []
+
+    rows = []
+    # If this response is a PDF, don't parse it as HTML
+    if is_pdf_response(rp):
+        print("           Response is a PDF — recording pdf_url and skipping HTML parsing.")
+        # The response itself is the PDF, so the paper URL is the PDF URL
+        pdf_url = paper_url
+        # Try to extract emails from PDF if a PDF text extractor is available, reusing this response's body
+        try:
+            pdf_authors = try_extract_from_pdf(session, pdf_url, resp=rp) if PDF_TEXT_AVAILABLE else []
+        finally:
+            rp.close()
+        if pdf_authors:
+            for a in pdf_authors:
+                rows.append([SITE_NAME, year, conf_title, track, paper_url, pdf_url, a.get('email',''), a.get('name',''), a.get('affiliation','')])
+        else:
+            rows.append([SITE_NAME, year, conf_title, track, paper_url, pdf_url, "", "", ""])
+        jitter_sleep()
+        return rows
+
+    # Otherwise treat as HTML
+    try:
+        paper_tree = lxml.html.fromstring(rp.content)
+    except Exception as e:
+        # If the parser still rejects it (rare, e.g. empty body), log and skip parsing as HTML
+        print(f"           HTML parser error for {paper_url}: {e}")
+        rows.append([SITE_NAME, year, conf_title, track, paper_url, "", "", "", ""])
+        jitter_sleep()
+        return rows
+
+    pdf_url = extract_pdf_url_from_page(paper_tree, paper_url)
+    authors = extract_authors_from_meta(paper_tree)
+    mailtos = extract_mailto_links(paper_tree)
+    existing_emails = {a['email'] for a in authors if a.get('email')}
+    for m in mailtos:
+        if m['email'] not in existing_emails:
+            authors.append(m); existing_emails.add(m['email'])
+    if not authors:
+        fb = fallback_text_author_search(paper_tree)
+        for f in fb:
+
+            if f['email'] not in existing_emails:
+                authors.append(f); existing_emails.add(f['email'])
+    if (not authors or not any(a.get('email') for a in authors)) and pdf_url:
+        pdf_auths = try_extract_from_pdf(session, pdf_url) if PDF_TEXT_AVAILABLE else []
+        for pa in pdf_auths:
+            if pa['email'] not in existing_emails:
+                authors.append(pa); existing_emails.add(pa['email'])
+    if not authors:
+        title_tags = paper_tree.xpath('(//h1|//h2|//title)[1]')
+        paper_title = element_text(title_tags[0]) if title_tags else ""
+        rows.append([SITE_NAME, year, conf_title, track, paper_url, pdf_url or "", "", paper_title, ""])
+    else:
+        for a in authors:
+            name = a.get('name','') or ""
+            email = a.get('email','') or ""
+            aff = a.get('affiliation','') or ""
+            if not name and email:
+                local = email.split('@')[0]
+                name = local.replace('.', ' ').replace('_',' ').title()
+            rows.append([SITE_NAME, year, conf_title, track, paper_url, pdf_url or "", email, name, aff])
+    jitter_sleep()
+    return rows
 
 def scrape():
     session = make_session()
@@ -213,34 +406,33 @@ def scrape():
         print("Bad status for START_URL:", r.status_code)
         return
 
-    soup = BeautifulSoup(r.content, 'html.parser')
-    blocks = soup.select('.libraryconf')
-    if not blocks:
-        possible = []
-        for div in soup.find_all(['div','section']):
-            if div.find('h2') and div.find('a'):
-                possible.append(div)
-        blocks = possible
+    try:
+        index_tree = lxml.html.fromstring(r.content)
+    except Exception as e:
+        print("HTML parser error for START_URL:", e)
+        return
+    blocks = CONF_BLOCK_XPATH(index_tree) or CONF_BLOCK_FALLBACK_XPATH(index_tree)
 
     print(f"Found {len(blocks)} conference blocks (heuristic).")
     write_csv_header(OUTPUT_CSV)
 
+    pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    # One buffered handle for the whole run; each paper's rows go out in a single writerows()
+    fh = open(OUTPUT_CSV, 'a', newline='', encoding='utf-8', buffering=1 << 16)
+    writer = csv.writer(fh)
     try:
         for b_idx, block in enumerate(blocks, start=1):
-            title_tag = block.find('h2')
-            conf_title = title_tag.get_text(" ", strip=True) if title_tag else "Unknown Conference"
-            ps = block.find_all('p')
-            description = " ".join([p.get_text(" ", strip=True) for p in ps]).strip() if ps else ""
+            title_tag = block.find('.//h2')
+            conf_title = element_text(title_tag) if title_tag is not None else "Unknown Conference"
             year_links = []
-            for a in block.find_all('a', href=True):
-                txt = a.get_text(strip=True)
-                m = re.findall(r'\b(19\d{2}|20\d{2})\b', txt)
+            for a in block.iterfind('.//a[@href]'):
+                href = a.get('href')
+                m = YEAR_RE.findall(a.text_content())
                 if m:
                     for year_text in m:
-                        year_links.append((int(year_text), normalize_url(START_URL, a['href'])))
+                        year_links.append((int(year_text), normalize_url(START_URL, href)))
                 else:
-                    href = a['href']
-                    m2 = re.search(r'(19\d{2}|20\d{2})', href)
+                    m2 = HREF_YEAR_RE.search(href)
                     if m2:
                         year_links.append((int(m2.group(1)), normalize_url(START_URL, href)))
 
@@ -254,6 +446,7 @@ def scrape():
 
             print(f"[{b_idx}/{len(blocks)}] Conference: {conf_title} — {len(unique_years)} years found")
 
+            seen_papers = set()  # year pages of one conference can list the same paper URLs
             for (year, year_url) in unique_years:
                 print(f"   -> Year {year}: {year_url}")
                 try:
@@ -265,93 +458,43 @@ def scrape():
                     print(f"      Year page returned {ry.status_code}")
                     continue
 
-                year_soup = BeautifulSoup(ry.content, 'html.parser')
+                try:
+                    year_tree = lxml.html.fromstring(ry.content)
+                except Exception as e:
+                    print(f"      HTML parser error for {year_url}: {e}")
+                    continue
                 track = ""
-                paper_candidates = find_candidate_paper_links(year_soup, year_url)
+                paper_candidates = find_candidate_paper_links(year_tree, year_url)
                 if not paper_candidates:
-                    for a in year_soup.find_all('a', href=True):
-                        href = a['href']
-                        if '.pdf' in href.lower():
-                            paper_candidates.append(normalize_url(year_url, href))
+                    paper_candidates = [normalize_url(year_url, href) for href in PDF_HREFS_XPATH(year_tree)]
                 if not paper_candidates:
                     print(f"      No candidate papers found on {year_url}")
                     continue
+                paper_candidates = [u for u in paper_candidates if u not in seen_papers]
                 if MAX_PAPERS_PER_YEAR:
                     paper_candidates = paper_candidates[:MAX_PAPERS_PER_YEAR]
+                seen_papers.update(paper_candidates)
                 print(f"      Found {len(paper_candidates)} candidate paper URLs (heuristic).")
 
-                for p_idx, paper_url in enumerate(paper_candidates, start=1):
-                    print(f"        [{p_idx}/{len(paper_candidates)}] Visiting {paper_url}")
-                    try:
-                        rp = safe_get(session, paper_url)
-                    except Exception as e:
-                        print(f"           Failed to GET: {e}")
-                        continue
-
-                    # If this response is a PDF, don't parse with BeautifulSoup
-                    if is_pdf_response(rp):
-                        print("           Response is a PDF — recording pdf_url and skipping HTML parsing.")
-                        pdf_url = paper_url if paper_url.lower().endswith('.pdf') else extract_pdf_url_from_page(BeautifulSoup(b"", 'html.parser'), paper_url) or paper_url
-                        # Try to extract emails from PDF if pdfminer is available
-                        pdf_authors = try_extract_from_pdf(session, pdf_url) if PDFMINER_AVAILABLE else []
-                        if pdf_authors:
-                            for a in pdf_authors:
-                                append_row(OUTPUT_CSV, [SITE_NAME, year, conf_title, track, paper_url, pdf_url, a.get('email',''), a.get('name',''), a.get('affiliation','')])
-                        else:
-                            append_row(OUTPUT_CSV, [SITE_NAME, year, conf_title, track, paper_url, pdf_url, "", "", ""])
-                        jitter_sleep()
-                        continue
-
-                    # Otherwise treat as HTML
-                    try:
-                        paper_soup = BeautifulSoup(rp.content, 'html.parser')
-                    except Exception as e:
-                        # If BeautifulSoup still rejects (rare), log and skip parsing as HTML
-                        print(f"           BeautifulSoup parser error for {paper_url}: {e}")
-                        append_row(OUTPUT_CSV, [SITE_NAME, year, conf_title, track, paper_url, "", "", "", ""])
-                        jitter_sleep()
-                        continue
-
-                    pdf_url = extract_pdf_url_from_page(paper_soup, paper_url)
-                    authors = extract_authors_from_meta(paper_soup)
-                    mailtos = extract_mailto_links(paper_soup)
-                    existing_emails = {a['email'] for a in authors if a.get('email')}
-                    for m in mailtos:
-                        if m['email'] not in existing_emails:
-                            authors.append(m); existing_emails.add(m['email'])
-                    if not authors:
-                        fb = fallback_text_author_search(paper_soup)
-                        for f in fb:
-
-                            if f['email'] not in existing_emails:
-                                authors.append(f); existing_emails.add(f['email'])
-                    if (not authors or not any(a.get('email') for a in authors)) and pdf_url:
-                        pdf_auths = try_extract_from_pdf(session, pdf_url) if PDFMINER_AVAILABLE else []
-                        for pa in pdf_auths:
-                            if pa['email'] not in existing_emails:
-                                authors.append(pa); existing_emails.add(pa['email'])
-                    if not authors:
-                        title_tag = paper_soup.find(['h1','h2','title'])
-                        paper_title = title_tag.get_text(" ", strip=True) if title_tag else ""
-                        append_row(OUTPUT_CSV, [SITE_NAME, year, conf_title, track, paper_url, pdf_url or "", "", paper_title, ""])
-                    else:
-                        for a in authors:
-                            name = a.get('name','') or ""
-                            email = a.get('email','') or ""
-                            aff = a.get('affiliation','') or ""
-                            if not name and email:
-                                local = email.split('@')[0]
-                                name = local.replace('.', ' ').replace('_',' ').title()
-                            append_row(OUTPUT_CSV, [SITE_NAME, year, conf_title, track, paper_url, pdf_url or "", email, name, aff])
-                    jitter_sleep()
+                # Papers of one year are fetched concurrently; rows are written in candidate order
+                futures = [pool.submit(scrape_paper, session, paper_url, p_idx, len(paper_candidates), year, conf_title, track)
+                           for p_idx, paper_url in enumerate(paper_candidates, start=1)]
+                for fut in futures:
+                    writer.writerows(fut.result())
                 jitter_sleep()
     except KeyboardInterrupt:
+        pool.shutdown(wait=False, cancel_futures=True)
         print("\n\nKeyboardInterrupt received — exiting gracefully.")
         print("Partial results saved to:", os.path.abspath(OUTPUT_CSV))
         return
+    finally:
+        fh.close()
+    pool.shutdown()
 
     print("\nScraping complete. Output CSV:", os.path.abspath(OUTPUT_CSV))
 
 if __name__ == "__main__":
+    print("PDFium available:", PDFIUM_AVAILABLE)
     print("PDFMiner available:", PDFMINER_AVAILABLE)
+    print("RE2 available:", RE2_AVAILABLE)
     scrape()
@@ -1,41 +1,217 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 import re
 import PyPDF2
 from io import BytesIO
 import time
 from urllib.parse import urljoin
+from functools import lru_cache
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
+import atexit
+import shelve
 import os
+import threading
+
+# PDFium-based text extraction is much faster than PyPDF2; used when installed
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+# Optional persistent HTTP cache; anthology pages and HEAD probes are stable across runs
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+HTTP_CACHE = "acl_http_cache"
+HEAD_WORKERS = 20  # concurrent HEAD probes during conference discovery
+PDF_TEXT_CACHE = "acl_pdf_text_cache"
+
+# Optional linear-time regex engine for the whole-page / whole-PDF email scans
+try:
+    import re2
+except ImportError:
+    re2 = re
+
+
+EMAIL_RE = re2.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+OLD_FORMAT_URL_RE = re.compile(r"/([A-Z])(\d{2})-?(\w*)/?$")
+EVENT_URL_RE = re.compile(r"/events/([^-/]+)-(\d+)/?$")
+OLD_PAPER_PATTERNS = (
+    r"/[A-Z]\d{2}-\d+/?$",  # P23-1001/
+    r"/W\d{2}-\d+/?$",  # W00-1301/
+)
+
+# Link filters run inside libxml2 (EXSLT regex extension), so only matching hrefs reach Python;
+# as plain str, since lxml smart strings would keep each parsed page alive in the result rows
+REGEXP_NS = {"re": "http://exslt.org/regular-expressions"}
+VOLUME_HREFS_XPATH = etree.XPath(
+    "//a/@href[contains(., $year) and contains(., '/volumes/')"
+    " and substring(., string-length(.)) = '/' and not(re:test(., '\\.\\d+/?$'))]",
+    namespaces=REGEXP_NS, smart_strings=False)
+EVENT_HREFS_XPATH = etree.XPath(
+    "//a/@href[contains(., $year) and contains(., '/events/') and not(re:test(., '\\.\\d+/?$'))]",
+    namespaces=REGEXP_NS, smart_strings=False)
+PAPER_HREFS_XPATH = etree.XPath("//a/@href[re:test(., $pattern)]", namespaces=REGEXP_NS, smart_strings=False)
+AUTHOR_LINKS_XPATH = etree.XPath("//a[contains(@href, '/people/')]")
+PDF_HREF_XPATH = etree.XPath("(//a/@href[substring(., string-length(.) - 3) = '.pdf'])[1]", smart_strings=False)
+
+
+@lru_cache(maxsize=64)
+def conference_url_patterns(year):
+    """Compiled year-specific volume patterns (modern and complex-name formats)."""
+    return (
+        re.compile(rf"{year}\.([^-/]+)-(.+?)/?$"),
+        re.compile(rf"{year}\.([^/]+)/?$"),
+    )
+
+
+@lru_cache(maxsize=64)
+def paper_url_pattern(year):
+    """Single alternation matching individual paper pages of a given year (for PAPER_HREFS_XPATH)."""
+    modern = rf"/{year}\.[^/]+\.\d+/?$"  # 2025.acl-main.123/
+    return "|".join((modern,) + OLD_PAPER_PATTERNS)
+
+
+def is_cacheable(response):
+    """Keep PDF bodies out of the HTTP cache; their extracted text is cached instead."""
+    return 'application/pdf' not in response.headers.get('Content-Type', '').lower()
+
+
+def make_session():
+    """Create one pooled keep-alive session for all aclanthology.org requests."""
+    if REQUESTS_CACHE_AVAILABLE:
+        s = requests_cache.CachedSession(HTTP_CACHE, backend='sqlite', expire_after=timedelta(days=30),
+                                         allowable_methods=('GET', 'HEAD'), filter_fn=is_cacheable)
+    else:
+        s = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5,
+                  status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(['GET', 'HEAD']))
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Lazily create the shared session so importing this module (main.py, PDF workers) opens no cache."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = make_session()
+        return _session
+
+# PDF text extraction is CPU-bound, so it runs in worker processes
+PDF_WORKERS = os.cpu_count() or 1
+# Pool workers come from a forkserver (spawn where there is none): the pool adds workers on demand
+# while other threads are running, and forking while one of them holds a lock can deadlock the child
+PDF_POOL_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+_pdf_pool = None
+_pdf_text_cache = None
+
+
+def get_pdf_pool():
+    """Lazily create the process pool so importing this module spawns nothing."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=PDF_POOL_CONTEXT)
+    return _pdf_pool
+
+
+def pdf_text_cache():
+    """Lazily open the shelve of extracted PDF text, keyed by PDF URL."""
+    global _pdf_text_cache
+    if _pdf_text_cache is None:
+        _pdf_text_cache = shelve.open(PDF_TEXT_CACHE)
+        atexit.register(_pdf_text_cache.close)
+    return _pdf_text_cache
+
+
+def pdf_text_from_bytes(data):
+    """Extract all text from raw PDF bytes (executed in a worker process)."""
+    if PDFIUM_AVAILABLE:
+        try:
+            pdf = pdfium.PdfDocument(data)
+            try:
+                return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+            finally:
+                pdf.close()
+        except Exception:
+            pass  # fall back to PyPDF2
 
+    reader = PyPDF2.PdfReader(BytesIO(data))
 
-def extract_emails_from_pdf(pdf_url):
-    """Download a PDF and extract emails from it."""
+    text = ""
+    for page in reader.pages:
+        text += page.extract_text() or ""
+    return text
+
+
+def pdf_text_and_emails(data):
+    """Extract a PDF's text and the emails in it (executed in a worker process).
+
+    Doing the email scan next to the extraction keeps the regex work off the main
+    process, which is busy fetching paper pages meanwhile.
+    """
+    text = pdf_text_from_bytes(data)
+    return text, set(EMAIL_RE.findall(text))
+
+
+def submit_pdf_extraction(pdf_url):
+    """Download a PDF and queue its text extraction. Returns a Future of (text, emails), or None on failure."""
     try:
         print(f"    Processing PDF: {pdf_url}")
-        response = requests.get(pdf_url, timeout=15)
-        response.raise_for_status()
+        cached_text = pdf_text_cache().get(pdf_url)
+        if cached_text is not None:
+            future = Future()
+            future.set_result((cached_text, set(EMAIL_RE.findall(cached_text))))
+            return future
 
-        pdf_file = BytesIO(response.content)
-        reader = PyPDF2.PdfReader(pdf_file)
-
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() or ""
+        response = get_session().get(pdf_url, timeout=15)
+        response.raise_for_status()
+        return get_pdf_pool().submit(pdf_text_and_emails, response.content)
 
-        emails = set()
-        email_matches = re.findall(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text)
-        for email in email_matches:
-            clean_email = re.search(r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", email)
-            if clean_email:
-                emails.add(clean_email.group(1))
+    except Exception as e:
+        print(f"    Error processing PDF {pdf_url}: {e}")
+        return None
 
-        print(f"    Found {len(emails)} emails in PDF")
-        return emails
 
+def collect_pdf_emails(pdf_url, future):
+    """Wait for a queued PDF extraction and return the emails found in it."""
+    if future is None:
+        return set()
+    try:
+        text, emails = future.result()
     except Exception as e:
         print(f"    Error processing PDF {pdf_url}: {e}")
         return set()
 
+    cache = pdf_text_cache()
+    if pdf_url not in cache:
+        cache[pdf_url] = text
+
+    print(f"    Found {len(emails)} emails in PDF")
+    return emails
+
+
+def extract_emails_from_pdf(pdf_url):
+    """Download a PDF and extract emails from it."""
+    return collect_pdf_emails(pdf_url, submit_pdf_extraction(pdf_url))
+
 
 def discover_all_conferences_for_year(year, max_discoveries=None):
     """Dynamically discover ALL conferences for a given year."""
@@ -46,30 +222,18 @@ def discover_all_conferences_for_year(year, max_discoveries=None):
     # Strategy 1: Crawl volumes directory
     try:
         volumes_url = "https://aclanthology.org/volumes/"
-        response = requests.get(volumes_url, timeout=15)
+        response = get_session().get(volumes_url, timeout=15)
 
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, "lxml")
-
-            for link in soup.find_all("a", href=True):
-                href = link["href"]
-
-                # Find URLs containing the year but NOT individual papers (ending with numbers)
-                if (str(year) in href and
-                        "/volumes/" in href and
-                        not re.search(r'\.\d+/?$', href) and
-                        href.endswith('/')):
+            tree = lxml.html.fromstring(response.content)
 
-                    full_url = urljoin(volumes_url, href)
-                    conf_info = extract_conference_info_from_url(full_url, year)
+            # URLs containing the year but NOT individual papers (ending with numbers); deduped up
+            # front so repeated links cost neither a urljoin nor a HEAD probe
+            candidates = [urljoin(volumes_url, href) for href in dict.fromkeys(VOLUME_HREFS_XPATH(tree, year=str(year)))]
+            discovered_conferences.extend(probe_conference_urls(candidates, year, max_discoveries))
 
-                    if conf_info and check_url_exists(full_url):
-                        discovered_conferences.append((full_url, conf_info['conference'], conf_info['track']))
-                        print(f"  Found: {conf_info['conference']} ({conf_info['track']}) - {full_url}")
-
-                        if max_discoveries and len(discovered_conferences) >= max_discoveries:
-                            print(f"  Limited to {max_discoveries} discoveries for testing")
-                            break
+            if max_discoveries and len(discovered_conferences) >= max_discoveries:
+                print(f"  Limited to {max_discoveries} discoveries for testing")
 
     except Exception as e:
         print(f"Error discovering volumes: {e}")
@@ -77,53 +241,69 @@ def discover_all_conferences_for_year(year, max_discoveries=None):
     # Strategy 2: Crawl events directory
     try:
         events_url = "https://aclanthology.org/events/"
-        response = requests.get(events_url, timeout=15)
+        response = get_session().get(events_url, timeout=15)
 
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, "lxml")
-
-            for link in soup.find_all("a", href=True):
-                href = link["href"]
-
-                if (str(year) in href and
-                        "/events/" in href and
-                        not re.search(r'\.\d+/?$', href)):
+            tree = lxml.html.fromstring(response.content)
 
-                    full_url = urljoin(events_url, href)
-                    conf_info = extract_conference_info_from_url(full_url, year)
-
-                    if conf_info and check_url_exists(full_url):
-                        discovered_conferences.append((full_url, conf_info['conference'], conf_info['track']))
-                        print(f"  Found: {conf_info['conference']} ({conf_info['track']}) - {full_url}")
-
-                        if max_discoveries and len(discovered_conferences) >= max_discoveries:
-                            break
+            # Dedupe hrefs up front so repeated links cost neither a urljoin nor a HEAD probe
+            candidates = [urljoin(events_url, href) for href in dict.fromkeys(EVENT_HREFS_XPATH(tree, year=str(year)))]
+            limit = max(max_discoveries - len(discovered_conferences), 0) if max_discoveries else None
+            discovered_conferences.extend(probe_conference_urls(candidates, year, limit))
 
     except Exception as e:
         print(f"Error discovering events: {e}")
 
-    # Remove duplicates
-    discovered_conferences = list(set(discovered_conferences))
+    # Remove duplicates, keeping discovery order (deterministic across runs)
+    discovered_conferences = list(dict.fromkeys(discovered_conferences))
 
     print(f"Total discovered for {year}: {len(discovered_conferences)} conferences")
     return discovered_conferences
 
 
+def probe_conference_urls(urls, year, limit=None):
+    """HEAD-probe candidate volume/event URLs concurrently, returning (url, conference, track) in page order.
+
+    Probes run in batches of HEAD_WORKERS so a small ``limit`` doesn't fire hundreds of requests.
+    """
+    candidates = []
+    for url in urls:
+        conf_info = extract_conference_info_from_url(url, year)
+        if conf_info:
+            candidates.append((url, conf_info))
+
+    found = []
+    if limit is not None and limit <= 0:
+        return found
+    with ThreadPoolExecutor(max_workers=HEAD_WORKERS) as executor:
+        for start in range(0, len(candidates), HEAD_WORKERS):
+            batch = candidates[start:start + HEAD_WORKERS]
+            for (url, conf_info), exists in zip(batch, executor.map(check_url_exists, [u for u, _ in batch])):
+                if not exists:
+                    continue
+                found.append((url, conf_info['conference'], conf_info['track']))
+                print(f"  Found: {conf_info['conference']} ({conf_info['track']}) - {url}")
+                if limit is not None and len(found) >= limit:
+                    return found
+    return found
+
+
 def extract_conference_info_from_url(url, year):
     """Extract conference name and track info from ANY URL pattern."""
     try:
         # Remove trailing slash for consistent processing
         clean_url = url.rstrip('/')
+        modern_re, complex_re = conference_url_patterns(year)
 
         # Pattern 1: Modern format like 2023.acl-main, 2023.emnlp-industry
-        match = re.search(rf"{year}\.([^-/]+)-(.+?)/?$", clean_url)
+        match = modern_re.search(clean_url)
         if match:
             conf_name = match.group(1).upper()
             track = match.group(2).title()
             return {'conference': conf_name, 'track': track}
 
         # Pattern 2: Complex names like 2003.jeptalnrecital-tutorial
-        match = re.search(rf"{year}\.([^/]+)/?$", clean_url)
+        match = complex_re.search(clean_url)
         if match:
             full_name = match.group(1)
             if '-' in full_name:
@@ -136,7 +316,7 @@ def extract_conference_info_from_url(url, year):
             return {'conference': conf_name, 'track': track}
 
         # Pattern 3: Old format like P23, N23, W00-13
-        match = re.search(r"/([A-Z])(\d{2})-?(\w*)/?$", clean_url)
+        match = OLD_FORMAT_URL_RE.search(clean_url)
         if match:
             letter = match.group(1)
             track_info = match.group(3) if match.group(3) else "Main"
@@ -149,7 +329,7 @@ def extract_conference_info_from_url(url, year):
             return {'conference': conf_name, 'track': track_info.title()}
 
         # Pattern 4: Event-based like /events/acl-2023/
-        match = re.search(r"/events/([^-/]+)-(\d+)/?$", clean_url)
+        match = EVENT_URL_RE.search(clean_url)
         if match:
             conf_name = match.group(1).upper()
             return {'conference': conf_name, 'track': 'Event'}
@@ -161,40 +341,26 @@ def extract_conference_info_from_url(url, year):
         return None
 
 
-def scrape_conference_page(url, conference_name, track, year, max_papers=None):
-    """Scrape a conference page to find individual paper pages."""
+def scrape_conference_page(url, conference_name, track, year, max_papers=None, seen_papers=None):
+    """Scrape a conference page to find individual paper pages.
+
+    ``seen_papers`` is an optional set of paper URLs already visited (e.g. via an overlapping
+    volume/event page); those are skipped, and newly visited ones are added to it.
+    """
     print(f"\nScraping {year} {conference_name} {track}: {url}")
 
     try:
-        response = requests.get(url, timeout=15)
+        response = get_session().get(url, timeout=15)
         response.raise_for_status()
     except Exception as e:
         print(f"Error fetching {url}: {e}")
         return []
 
-    soup = BeautifulSoup(response.text, "lxml")
+    tree = lxml.html.fromstring(response.content)
 
-    # Find individual paper page links
-    paper_links = []
-
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-
-        # Look for individual paper patterns
-        patterns = [
-            rf"/{year}\.[^/]+\.\d+/?$",  # 2025.acl-main.123/
-            r"/[A-Z]\d{2}-\d+/?$",  # P23-1001/
-            r"/W\d{2}-\d+/?$",  # W00-1301/
-        ]
-
-        for pattern in patterns:
-            if re.search(pattern, href):
-                full_url = urljoin(url, href)
-                paper_links.append(full_url)
-                break
-
-    # Remove duplicates and apply limit
-    paper_links = list(set(paper_links))
+    # Find individual paper page links; remove duplicates (first-seen order) and apply limit
+    hrefs = dict.fromkeys(PAPER_HREFS_XPATH(tree, pattern=paper_url_pattern(year)))
+    paper_links = list(dict.fromkeys(urljoin(url, href) for href in hrefs))
 
     if max_papers and len(paper_links) > max_papers:
         print(f"  Limiting to {max_papers} papers for faster testing")
@@ -204,8 +370,14 @@ def scrape_conference_page(url, conference_name, track, year, max_papers=None):
 
     # Process each paper page (NESTED PROCESSING)
     results = []
+    pending = []
 
     for i, paper_url in enumerate(paper_links, 1):
+        if seen_papers is not None:
+            if paper_url in seen_papers:
+                print(f"Skipping paper {i}/{len(paper_links)} (already scraped): {paper_url}")
+                continue
+            seen_papers.add(paper_url)
         print(f"Processing paper {i}/{len(paper_links)}: {paper_url}")
 
         # NESTED: Visit individual paper page
@@ -213,56 +385,62 @@ def scrape_conference_page(url, conference_name, track, year, max_papers=None):
         if not paper_data:
             continue
 
-        # Extract emails from PDF
+        # Queue PDF text extraction; workers parse while we keep fetching pages
         if paper_data['pdf_link']:
-            pdf_emails = extract_emails_from_pdf(paper_data['pdf_link'])
-
-            for j, email in enumerate(pdf_emails):
-                name = "Unknown"
-                affiliation = "Unknown"
-
-                if paper_data['authors_info'] and j < len(paper_data['authors_info']):
-                    author_info = paper_data['authors_info'][j]
-                    name = author_info['name']
-                    affiliation = author_info['affiliation']
-                elif paper_data['authors_info']:
-                    author_info = paper_data['authors_info'][0]
-                    name = author_info['name']
-                    affiliation = author_info['affiliation']
-
-                results.append({
-                    "site": "ACL Anthology",
-                    "year": str(year),
-                    "conference": conference_name,
-                    "track": track,
-                    "paper_url": paper_url,
-                    "pdf_url": paper_data['pdf_link'],
-                    "email": email,
-                    "name": name,
-                    "affiliation": affiliation
-                })
+            pending.append((paper_url, paper_data, submit_pdf_extraction(paper_data['pdf_link'])))
 
         time.sleep(0.3)  # Be respectful to server
 
+    # Extract emails from PDFs
+    for paper_url, paper_data, future in pending:
+        pdf_emails = collect_pdf_emails(paper_data['pdf_link'], future)
+
+        for j, email in enumerate(pdf_emails):
+            name = "Unknown"
+            affiliation = "Unknown"
+
+            if paper_data['authors_info'] and j < len(paper_data['authors_info']):
+                author_info = paper_data['authors_info'][j]
+                name = author_info['name']
+                affiliation = author_info['affiliation']
+            elif paper_data['authors_info']:
+                author_info = paper_data['authors_info'][0]
+                name = author_info['name']
+                affiliation = author_info['affiliation']
+
+            results.append({
+                "site": "ACL Anthology",
+                "year": str(year),
+                "conference": conference_name,
+                "track": track,
+                "paper_url": paper_url,
+                "pdf_url": paper_data['pdf_link'],
+                "email": email,
+                "name": name,
+                "affiliation": affiliation
+            })
+
     return results
 
 
-def extract_author_info_from_paper_page(paper_url, year, conference):
-    """NESTED: Extract author info from individual paper page."""
+def extract_author_info_from_paper_page(paper_url, year, conference, collect_page_emails=False):
+    """NESTED: Extract author info from individual paper page.
+
+    The whole-page email scan is only done with ``collect_page_emails=True``; callers
+    that just need the authors and PDF link skip materialising the page text.
+    """
     try:
         print(f"  Scraping paper page: {paper_url}")
-        response = requests.get(paper_url, timeout=10)
+        response = get_session().get(paper_url, timeout=10)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "lxml")
+        tree = lxml.html.fromstring(response.content)
 
         authors_info = []
 
         # Look for author links
-        author_links = soup.find_all("a", href=re.compile(r"/people/"))
-
-        for link in author_links:
-            author_name = link.get_text().strip()
+        for link in AUTHOR_LINKS_XPATH(tree):
+            author_name = link.text_content().strip()
             if author_name:
                 authors_info.append({
                     'name': author_name,
@@ -270,25 +448,20 @@ def extract_author_info_from_paper_page(paper_url, year, conference):
                 })
 
         # Extract emails from page
-        page_text = soup.get_text()
-        emails_on_page = set()
-        email_matches = re.findall(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", page_text)
-        for email in email_matches:
-            clean_email = re.search(r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", email)
-            if clean_email:
-                emails_on_page.add(clean_email.group(1))
+        emails_on_page = set(EMAIL_RE.findall(tree.text_content())) if collect_page_emails else set()
 
         # Find PDF link
         pdf_link = None
-        for link in soup.find_all("a", href=True):
-            if link["href"].endswith(".pdf"):
-                if link["href"].startswith("http"):
-                    pdf_link = link["href"]
-                else:
-                    pdf_link = urljoin("https://aclanthology.org", link["href"])
-                break
+        for href in PDF_HREF_XPATH(tree):
+            if href.startswith("http"):
+                pdf_link = href
+            else:
+                pdf_link = urljoin("https://aclanthology.org", href)
 
-        print(f"  Found {len(authors_info)} authors, {len(emails_on_page)} emails on page")
+        if collect_page_emails:
+            print(f"  Found {len(authors_info)} authors, {len(emails_on_page)} emails on page")
+        else:
+            print(f"  Found {len(authors_info)} authors")
 
         return {
             'authors_info': authors_info,
@@ -304,6 +477,7 @@ def extract_author_info_from_paper_page(paper_url, year, conference):
 def scrape_acl_dynamic(start_year, end_year, max_conferences_per_year=None, max_papers_per_conference=None):
     """Main function: Dynamic discovery and scraping with testing controls."""
     all_results = []
+    seen_papers = set()  # volumes and events cross-list the same papers
 
     for year in range(start_year, end_year + 1):
         print(f"\n=== YEAR {year} ===")
@@ -318,7 +492,7 @@ def scrape_acl_dynamic(start_year, end_year, max_conferences_per_year=None, max_
         # Process each discovered conference
         for url, conference_name, track in discovered_conferences:
             try:
-                conf_results = scrape_conference_page(url, conference_name, track, year, max_papers_per_conference)
+                conf_results = scrape_conference_page(url, conference_name, track, year, max_papers_per_conference, seen_papers)
                 all_results.extend(conf_results)
                 print(f"{year} {conference_name} {track}: {len(conf_results)} emails found")
 
@@ -335,7 +509,7 @@ def scrape_acl_dynamic(start_year, end_year, max_conferences_per_year=None, max_
 def check_url_exists(url):
     """Check if a URL exists without downloading full content."""
     try:
-        response = requests.head(url, timeout=5, allow_redirects=True)
+        response = get_session().head(url, timeout=5, allow_redirects=True)
         return response.status_code == 200
     except:
         return False
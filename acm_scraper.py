@@ -6,14 +6,22 @@ Output: acm_all_papers.csv
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 import re
 import csv
 import time
 import random
 import os
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import json
 from urllib.parse import urljoin, urlparse, parse_qs
+from concurrent.futures import ThreadPoolExecutor
 
 # Try to import PDF parsing library
 try:
@@ -29,46 +37,168 @@ except ImportError:
     except ImportError:
         PYPDF2_AVAILABLE = False
 
+# Optional linear-time regex engine for the bulk email scans
+try:
+    import re2
+except ImportError:
+    re2 = re
+
+# Optional persistent HTTP cache; reruns and repeated index fetches become SQLite reads
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
 # ---------- CONFIG ----------
 START_URL = "https://dl.acm.org/proceedings"
 SITE_NAME = "ACM Digital Library"
+SITE_ROOT = "{0.scheme}://{0.netloc}".format(urlparse(START_URL))  # for join_url fast path
 OUTPUT_CSV = "acm_all_papers.csv"
 
 # IMPORTANT: A specific User-Agent is less likely to be blocked.
 USER_AGENT = "ACMExtractor/1.0 (Contact: user@example.com)"
 REQUEST_TIMEOUT = 20  # Increased timeout for large files/slow response
-DELAY_BASE = 3.0  # **Crucial: Be very polite to ACM**
+DELAY_BASE = 3.0  # **Crucial: Be very polite to ACM** (pause until the host's latency is known)
+MIN_DELAY = DELAY_BASE  # ACM: never pause less than the polite base
+LATENCY_FACTOR = 2.0  # Pause ~this many times the host's last response time
+MAX_LATENCY_FACTOR = 32.0  # Cap for the factor while the host keeps answering 429/503
+JITTER = 0.5  # Random extra pause, as a fraction of the computed delay
+HTTP_CACHE = "acm_http_cache"  # requests-cache SQLite file for HTML pages
+CACHE_EXPIRE = timedelta(days=1)  # fallback lifetime when the server sends no Cache-Control
 
 # Testing limits
 MAX_PROCEEDINGS_GROUPS = 2  # Max number of alphabetical groups (e.g., '3', 'd')
 MAX_CONFERENCES_PER_GROUP = 3  # Max conferences to visit per group
 MAX_PAPERS_PER_CONFERENCE = 5  # Max papers to scrape per conference
+MAX_WORKERS = 2  # Concurrent paper-page fetches; kept low, ACM throttles aggressively
 
 
 # ----------------------------
 
+FIELDNAMES = ['site', 'year', 'conference', 'track', 'paper_url',
+              'pdf_url', 'email', 'name', 'affiliation']
+
+NO_AUTHORS_ROW = {'email': '', 'name': 'No Authors Found', 'affiliation': ''}
+
+# Precompiled patterns used on every page
+EMAIL_RE = re2.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+YEAR_RE = re.compile(r'(19\d{2}|20\d{2})')
+PDF_LABEL_RE = re.compile(r'PDF')
+
+# Parse only the tags each page type reads (matched tags keep their whole subtree)
+# Index page: accordion headers, then per header the conference links in its sibling body
+GROUP_HEADERS_XPATH = etree.XPath("//div[contains(@class, 'proc-group-header-')]")
+GROUP_CONFERENCES_XPATH = etree.XPath("following-sibling::div[1]//a[contains(@href, '/proceedings/')]")
+
+PAPER_LINK_STRAINER = SoupStrainer('a', class_='issue-item-title')
+PAPER_PAGE_STRAINER = SoupStrainer(['h1', 'span', 'a', 'li'])
+
+
+def is_cacheable(response):
+    """Keep PDF bodies out of the HTTP cache (they are large and streamed)."""
+    return 'application/pdf' not in response.headers.get('Content-Type', '').lower()
+
+
 def make_session():
-    """Create a requests session with proper headers."""
-    s = requests.Session()
-    s.headers.update({"User-Agent": USER_AGENT})
+    """Create a pooled keep-alive session with retries and proper headers."""
+    if REQUESTS_CACHE_AVAILABLE:
+        # The index page is revalidated on every run: a conditional GET (If-None-Match /
+        # If-Modified-Since from the stored ETag / Last-Modified) costs a 304 when it hasn't changed
+        index_url = re.compile('^' + re.escape(START_URL) + '$')
+        s = requests_cache.CachedSession(HTTP_CACHE, backend='sqlite', expire_after=CACHE_EXPIRE,
+                                         urls_expire_after={index_url: requests_cache.EXPIRE_IMMEDIATELY},
+                                         allowable_methods=('GET',), cache_control=True,
+                                         filter_fn=is_cacheable)
+    else:
+        s = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5,
+                  status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(['GET', 'HEAD']),
+                  # Hand the last 429/503 back instead of raising, so record_response sees the throttling
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    # Accept-Encoding is left to requests/urllib3, which only offer codecs they can decode
+    s.hooks['response'].append(record_response)
+    s.headers.update({"User-Agent": USER_AGENT,
+                      "Accept": "text/html,application/xhtml+xml,application/pdf;q=0.9,*/*;q=0.8"})
     return s
 
 
-def jitter_sleep():
-    """Sleep with random jitter to be respectful."""
-    time.sleep(DELAY_BASE + random.uniform(0, DELAY_BASE * 0.5))
+def join_url(base, href):
+    """urljoin() with string fast paths for the common href shapes on these pages."""
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('/'):
+        if not href.startswith('//') and (base == SITE_ROOT or base.startswith(SITE_ROOT + '/')):
+            return SITE_ROOT + href
+    elif base.endswith('/') and ':' not in href and not href.startswith(('.', '?', '#')):
+        return base + href
+    return urljoin(base, href)
+
+
+# Per-host pacing state, fed by the session's response hook (see polite_sleep)
+_host_state = {}
+_host_lock = threading.Lock()
+
+
+def retry_after_seconds(value):
+    """Seconds requested by a Retry-After header (delta-seconds or HTTP date); 0 if absent/invalid."""
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def record_response(response, *args, **kwargs):
+    """Session response hook: remember each host's latency and throttling signals."""
+    host = urlparse(response.url).netloc
+    with _host_lock:
+        state = _host_state.setdefault(host, {'latency': 0.0, 'factor': LATENCY_FACTOR, 'retry_after': 0.0})
+        state['from_cache'] = getattr(response, 'from_cache', False)
+        if state['from_cache']:
+            return
+        state['latency'] = response.elapsed.total_seconds()
+        if response.status_code in (429, 503):
+            # Throttled: double the latency multiplier until the host answers normally again
+            state['factor'] = min(state['factor'] * 2, MAX_LATENCY_FACTOR)
+            state['retry_after'] = retry_after_seconds(response.headers.get('Retry-After'))
+        else:
+            state['factor'] = LATENCY_FACTOR
+            state['retry_after'] = 0.0
+
+
+def polite_sleep(url):
+    """Sleep before the next request to ``url``'s host, scaled to how fast that host last answered.
+
+    Waits max(MIN_DELAY, LATENCY_FACTOR x last latency, Retry-After) plus jitter, DELAY_BASE for a
+    host not seen yet, and not at all after a response served from the local HTTP cache.
+    """
+    with _host_lock:
+        state = _host_state.get(urlparse(url).netloc)
+        state = dict(state) if state else None
+    if state is None:
+        delay = DELAY_BASE
+    elif state['from_cache']:
+        return
+    else:
+        delay = max(MIN_DELAY, state['latency'] * state['factor'], state['retry_after'])
+    time.sleep(delay + random.uniform(0, delay * JITTER))
 
 
 def extract_emails_from_text(text):
     """Extract all email addresses from text."""
     # ACM often hides emails behind images or requires login, but we check text anyway
-    emails = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-    clean_emails = set()
-    for email in emails:
-        email = email.strip().lower()
-        if '@' in email and '.' in email.split('@')[1]:
-            clean_emails.add(email)
-    return list(clean_emails)
+    # EMAIL_RE already guarantees one '@' and a dotted domain, so lowercasing is all that's left
+    return list({email.lower() for email in EMAIL_RE.findall(text)})
 
 
 def extract_emails_from_pdf(pdf_url, session):
@@ -92,21 +222,27 @@ def discover_proceedings_groups(session, max_groups=None):
         print(f"Error fetching proceedings page: {e}")
         return []
 
-    soup = BeautifulSoup(response.content, 'html.parser')
+    # Full parse (each header's conference list lives in its sibling accordion body), via lxml XPath
+    try:
+        tree = lxml.html.fromstring(response.content)
+    except (etree.ParserError, etree.ParseError, ValueError) as e:
+        print(f"Proceedings page is empty or unparseable: {e}")
+        return []
     proceedings_groups = []
 
     # Find the sections like '3', 'pD-Sec', '5G-MeMU' (these are accordion headers)
-    groups = soup.find_all('div', class_=re.compile(r'proc-group-header-'))
+    for group in GROUP_HEADERS_XPATH(tree):
+        title = stripped_text(group).split('\n')[0].split('(')[0].strip()
 
-    for group in groups:
-        title = group.get_text(strip=True).split('\n')[0].split('(')[0].strip()
+        # The actual conference links are inside the subsequent sibling (accordion body);
+        # collect them now so scrape_proceedings_group needn't refetch the index
+        conferences = [{'title': stripped_text(a), 'url': join_url(START_URL, a.get('href'))}
+                       for a in GROUP_CONFERENCES_XPATH(group)]
 
-        # The actual conference links are inside the subsequent sibling (accordion body)
-        # However, for simplicity and stability, we use the URL to the main proceedings page
-        # as the context and rely on later scraping to find the conference links.
         proceedings_groups.append({
             'title': title,
-            'url': START_URL  # We start processing from the main page and navigate internally
+            'url': START_URL,
+            'conferences': conferences
         })
 
     if max_groups:
@@ -122,35 +258,7 @@ def scrape_proceedings_group(session, group_info, max_conferences=None):
 
     print(f"\nScraping Group: {group_title}")
 
-    # Refetch the main page to find the specific group content
-    try:
-        response = session.get(START_URL, timeout=REQUEST_TIMEOUT)
-        if response.status_code != 200:
-            return []
-    except Exception as e:
-        print(f"  Error fetching page for group {group_title}: {e}")
-        return []
-
-    soup = BeautifulSoup(response.content, 'html.parser')
-    conference_links = []
-
-    # Find the specific group header based on text
-    target_header = soup.find('div', class_=re.compile(r'proc-group-header-'),
-                              text=re.compile(r'^\s*' + re.escape(group_title.split(':')[0].strip()) + r'.*'))
-
-    if target_header:
-        # The list of conferences is in the sibling element (the accordion body)
-        conference_list_div = target_header.find_next_sibling('div')
-        if conference_list_div:
-            # Find all conference links within that list
-            for a in conference_list_div.find_all('a', href=True):
-                if '/proceedings/' in a['href']:
-                    conference_url = urljoin(START_URL, a['href'])
-                    conference_title = a.get_text(strip=True)
-                    conference_links.append({
-                        'title': conference_title,
-                        'url': conference_url
-                    })
+    conference_links = group_info['conferences']
 
     if not conference_links:
         print(f"  No conferences found in group {group_title}")
@@ -169,7 +277,7 @@ def scrape_proceedings_group(session, group_info, max_conferences=None):
         conf_results = scrape_conference_page(session, conf, MAX_PAPERS_PER_CONFERENCE)
         group_results.extend(conf_results)
 
-        jitter_sleep()
+        polite_sleep(conf['url'])
 
     return group_results
 
@@ -188,7 +296,7 @@ def scrape_conference_page(session, conf_info, max_papers=None):
         print(f"      Error fetching conference page: {e}")
         return []
 
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = BeautifulSoup(response.content, 'lxml', parse_only=PAPER_LINK_STRAINER)
     results = []
 
     # Find all paper links
@@ -198,7 +306,7 @@ def scrape_conference_page(session, conf_info, max_papers=None):
     for a in soup.find_all('a', href=True, class_='issue-item-title'):
         href = a['href']
         if '/doi/' in href:
-            paper_url = urljoin(conf_url, href)
+            paper_url = join_url(conf_url, href)
             paper_title = a.get_text(strip=True)
             paper_links.append({'title': paper_title, 'url': paper_url})
 
@@ -211,14 +319,34 @@ def scrape_conference_page(session, conf_info, max_papers=None):
 
     print(f"      Found {len(paper_links)} papers to process.")
 
-    for paper in paper_links:
-        paper_results = scrape_paper_page(session, paper['url'], conf_title)
-        results.extend(paper_results)
-        jitter_sleep()
+    # Paper pages are fetched by a small thread pool; results keep the page order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [pool.submit(polite_scrape_paper_page, session, paper['url'], conf_title)
+                   for paper in paper_links]
+        try:
+            for future in futures:
+                results.extend(future.result())
+        except BaseException:
+            # Ctrl-C (or a failed paper): drop the queued papers instead of draining them on exit
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
 
     return results
 
 
+def stripped_text(el):
+    """lxml counterpart of BeautifulSoup's get_text(strip=True)."""
+    return "".join(t.strip() for t in el.itertext())
+
+
+def polite_scrape_paper_page(session, paper_url, conference_title):
+    """Worker task: scrape one paper page, then pause before this worker's next request."""
+    try:
+        return scrape_paper_page(session, paper_url, conference_title)
+    finally:
+        polite_sleep(paper_url)
+
+
 def scrape_paper_page(session, paper_url, conference_title):
     """Scrape individual paper page for authors and emails."""
     try:
@@ -230,7 +358,7 @@ def scrape_paper_page(session, paper_url, conference_title):
         print(f"        Error fetching paper page: {e}")
         return []
 
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = BeautifulSoup(response.content, 'lxml', parse_only=PAPER_PAGE_STRAINER)
     results = []
 
     # --- Extract Metadata ---
@@ -240,85 +368,52 @@ def scrape_paper_page(session, paper_url, conference_title):
     year = "Unknown"
     date_tag = soup.find('span', class_='citation__date')
     if date_tag:
-        year_match = re.search(r'(19\d{2}|20\d{2})', date_tag.get_text())
+        year_match = YEAR_RE.search(date_tag.get_text())
         year = year_match.group(1) if year_match else "Unknown"
 
     pdf_url = None
     # PDF link often involves a "fulltext" or "download" button with a complex URL
-    pdf_button = soup.find('a', class_='issue-navigation__content-link', text=re.compile(r'PDF'))
+    pdf_button = soup.find('a', class_='issue-navigation__content-link', text=PDF_LABEL_RE)
     if pdf_button and 'href' in pdf_button.attrs:
-        pdf_url = urljoin(paper_url, pdf_button['href'])
+        pdf_url = join_url(paper_url, pdf_button['href'])
 
     # --- Extract Authors and Affiliations ---
     authors_data = []
     # Find all author list items
-    author_list = soup.find_all('li', class_='author-list__item')
+    # CSS selectors are compiled once by soupsieve; per-item lookups keep name/affiliation paired
+    author_list = soup.select('li.author-list__item')
 
     for author_item in author_list:
-        name_tag = author_item.find('a', class_='author-name')
+        name_tag = author_item.select_one('a.author-name')
         name = name_tag.get_text(strip=True) if name_tag else 'Unknown Author'
 
         # Affiliation is often in a sibling div
-        aff_tag = author_item.find('div', class_='author-affiliation')
+        aff_tag = author_item.select_one('div.author-affiliation')
         affiliation = aff_tag.get_text(strip=True) if aff_tag else ''
 
         # ACM rarely exposes emails on the public page
         authors_data.append({'name': name, 'affiliation': affiliation, 'email': ''})
 
-    # Since direct email extraction is hard on ACM, we record what we have
-    if authors_data:
-        for author in authors_data:
-            # We skip PDF extraction here as ACM PDF URLs are often not directly downloadable
-            # without proper session/cookie handling from the abstract page.
-
-            results.append({
-                'site': SITE_NAME,
-                'year': year,
-                'conference': conference_title,
-                'track': paper_title,  # Using paper title as the 'track' for specificity
-                'paper_url': paper_url,
-                'pdf_url': pdf_url or '',
-                'email': author['email'],  # Will be empty unless we get more sophisticated
-                'name': author['name'],
-                'affiliation': author['affiliation']
-            })
-    else:
-        # Fallback for papers with no easily scraped author list
-        results.append({
-            'site': SITE_NAME,
-            'year': year,
-            'conference': conference_title,
-            'track': paper_title,
-            'paper_url': paper_url,
-            'pdf_url': pdf_url or '',
-            'email': '',
-            'name': 'No Authors Found',
-            'affiliation': ''
-        })
+    # Since direct email extraction is hard on ACM, we record what we have.
+    # We skip PDF extraction here as ACM PDF URLs are often not directly downloadable
+    # without proper session/cookie handling from the abstract page.
+    base = {
+        'site': SITE_NAME,
+        'year': year,
+        'conference': conference_title,
+        'track': paper_title,  # Using paper title as the 'track' for specificity
+        'paper_url': paper_url,
+        'pdf_url': pdf_url or '',
+    }
+    # Fallback row for papers with no easily scraped author list
+    for author in authors_data or [NO_AUTHORS_ROW]:
+        row = base.copy()
+        row.update(author)  # email will be empty unless we get more sophisticated
+        results.append(row)
 
     return results
 
 
-def write_csv_header():
-    """Write CSV header if file doesn't exist."""
-    if not os.path.exists(OUTPUT_CSV):
-        with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['site', 'year', 'conference', 'track', 'paper_url',
-                             'pdf_url', 'email', 'name', 'affiliation'])
-
-
-def append_results(results):
-    """Append results to CSV file."""
-    with open(OUTPUT_CSV, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        for r in results:
-            writer.writerow([
-                r['site'], r['year'], r['conference'], r['track'],
-                r['paper_url'], r['pdf_url'], r['email'], r['name'], r['affiliation']
-            ])
-
-
 def main():
     """Main scraping function."""
     print("=" * 60)
@@ -328,56 +423,81 @@ def main():
     print(
         f"PDF extraction available: pdfminer={PDFMINER_AVAILABLE}, PyPDF2={PYPDF2_AVAILABLE if not PDFMINER_AVAILABLE else 'N/A'}")
     print("NOTE: PDF extraction is currently disabled due to ACM site restrictions.")
-    print(f"Delay set to {DELAY_BASE} seconds to respect ACM servers.")
+    print(f"Delay set to at least {DELAY_BASE} seconds to respect ACM servers.")
     print()
 
-    # Clear old results
-    if os.path.exists(OUTPUT_CSV):
-        os.remove(OUTPUT_CSV)
-        print(f"Cleared previous {OUTPUT_CSV}")
-
-    write_csv_header()
-
-    session = make_session()
-
-    # Discover all proceedings groups (e.g., those starting with 3, pD, 5G)
-    groups = discover_proceedings_groups(session, max_groups=MAX_PROCEEDINGS_GROUPS)
-
-    if not groups:
-        print("No proceedings groups found! ACM site structure may have changed.")
-        return
-
-    print(f"\nStarting to scrape {len(groups)} proceedings groups...")
-
-    total_authors = 0
-    total_emails = 0  # Will likely be 0 for this version
-
+    # One handle for the whole run; each batch goes out in a single writerows(). Rows go to a
+    # .part file that replaces OUTPUT_CSV when the run ends (also on Ctrl-C), so a crash
+    # leaves the previous results untouched. A run that saved no rows (nothing discovered, every
+    # group came back empty, or it was interrupted first) never replaces it.
+    part_path = OUTPUT_CSV + '.part'
+    groups_saved = 0  # groups that wrote at least one row
+    f = open(part_path, 'w', newline='', encoding='utf-8')
     try:
-        for idx, group_info in enumerate(groups, 1):
-            print(f"\n[{idx}/{len(groups)}]")
-            results = scrape_proceedings_group(session, group_info, max_conferences=MAX_CONFERENCES_PER_GROUP)
-
-            if results:
-                append_results(results)
-                authors_found = len(results)
-                emails_found = len([r for r in results if r['email']])
-                total_authors += authors_found
-                total_emails += emails_found
-                print(f"  Saved {authors_found} author/paper records from this group.")
-
-            jitter_sleep()
-
-    except KeyboardInterrupt:
-        print("\n\nKeyboardInterrupt - Stopping gracefully...")
-        print(f"Partial results saved to: {OUTPUT_CSV}")
-        return
-
-    print("\n" + "=" * 60)
-    print("SCRAPING COMPLETE")
-    print("=" * 60)
-    print(f"Total author/paper records extracted: {total_authors}")
-    print(f"Total emails extracted (expected low/zero): {total_emails}")
-    print(f"Results saved to: {os.path.abspath(OUTPUT_CSV)}")
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+
+        session = make_session()
+
+        # Discover all proceedings groups (e.g., those starting with 3, pD, 5G)
+        groups = discover_proceedings_groups(session, max_groups=MAX_PROCEEDINGS_GROUPS)
+
+        if not groups:
+            print("No proceedings groups found! ACM site structure may have changed.")
+            return
+
+        print(f"\nStarting to scrape {len(groups)} proceedings groups...")
+
+        total_authors = 0
+        total_emails = 0  # Will likely be 0 for this version
+
+        try:
+            for idx, group_info in enumerate(groups, 1):
+                print(f"\n[{idx}/{len(groups)}]")
+                results = scrape_proceedings_group(session, group_info, max_conferences=MAX_CONFERENCES_PER_GROUP)
+
+                if results:
+                    writer.writerows(results)
+                    f.flush()  # keep partial results on disk
+                    authors_found = len(results)
+                    emails_found = len([r for r in results if r['email']])
+                    total_authors += authors_found
+                    total_emails += emails_found
+                    print(f"  Saved {authors_found} author/paper records from this group.")
+                    groups_saved += 1
+
+                polite_sleep(START_URL)
+
+        except KeyboardInterrupt:
+            print("\n\nKeyboardInterrupt - Stopping gracefully...")
+            if groups_saved:
+                print(f"Partial results saved to: {OUTPUT_CSV}")
+            return
+
+        print("\n" + "=" * 60)
+        print("SCRAPING COMPLETE")
+        print("=" * 60)
+        print(f"Total author/paper records extracted: {total_authors}")
+        print(f"Total emails extracted (expected low/zero): {total_emails}")
+        if groups_saved:
+            print(f"Results saved to: {os.path.abspath(OUTPUT_CSV)}")
+
+    except Exception:
+        f.close()
+        if groups_saved:
+            print(f"Run failed; previous {OUTPUT_CSV} left untouched, partial output in {part_path}")
+        else:
+            os.remove(part_path)
+            print(f"Run failed; previous {OUTPUT_CSV} left untouched")
+        raise
+    finally:
+        if not f.closed:
+            f.close()
+            if groups_saved:
+                os.replace(part_path, OUTPUT_CSV)
+            else:
+                os.remove(part_path)
+                print(f"Nothing scraped; previous {OUTPUT_CSV} left untouched")
 
 
 if __name__ == "__main__":
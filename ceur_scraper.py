@@ -6,18 +6,30 @@ Output: ceur_all_papers.csv
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 import re
 import csv
 import time
 import random
 import os
-from urllib.parse import urljoin
-from io import BytesIO
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin, urlparse
+import hashlib
+import shutil
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 # Try to import PDF parsing library
 try:
     from pdfminer.high_level import extract_text
+    from pdfminer.pdfpage import PDFPage
 
     PDFMINER_AVAILABLE = True
 except ImportError:
@@ -27,47 +39,178 @@ except ImportError:
         PDFMINER_AVAILABLE = False
         PYPDF2_AVAILABLE = True
     except ImportError:
+        PDFMINER_AVAILABLE = False
         PYPDF2_AVAILABLE = False
 
+# PDFium bindings are much faster than pdfminer; preferred when installed
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+# Optional linear-time regex engine for the bulk email scans
+try:
+    import re2
+except ImportError:
+    re2 = re
+
+# Optional persistent HTTP cache; reruns and repeated index fetches become SQLite reads
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
 # ---------- CONFIG ----------
 START_URL = "https://ceur-ws.org/"
 SITE_NAME = "CEUR-WS"
+SITE_ROOT = "{0.scheme}://{0.netloc}".format(urlparse(START_URL))  # for join_url fast path
 OUTPUT_CSV = "ceur_all_papers.csv"
 
 USER_AGENT = "CEUR-Scraper/1.0"
 REQUEST_TIMEOUT = 15
-DELAY_BASE = 1.0  # Be respectful to CEUR servers
+DELAY_BASE = 1.0  # Be respectful to CEUR servers (pause until the host's latency is known)
+MIN_DELAY = 0.2  # Floor for the adaptive pause once the host's latency is known
+LATENCY_FACTOR = 2.0  # Pause ~this many times the host's last response time
+MAX_LATENCY_FACTOR = 32.0  # Cap for the factor while the host keeps answering 429/503
+JITTER = 0.3  # Random extra pause, as a fraction of the computed delay
+HTTP_CACHE = "ceur_http_cache"  # requests-cache SQLite file for HTML pages
+PDF_CACHE_DIR = "ceur_pdf_cache"  # Downloaded PDFs, named by URL hash, reused across runs
+CACHE_EXPIRE = timedelta(days=1)  # fallback lifetime when the server sends no Cache-Control
 
 # Testing limits
 MAX_VOLUMES = None  # Set to number for testing (e.g., 5)
 MAX_PAPERS_PER_VOLUME = None  # Set to number for testing (e.g., 3)
+MAX_WORKERS = 4  # Concurrent PDF downloads per volume
+PDF_WORKERS = os.cpu_count() or 1  # Processes for CPU-bound PDF text extraction
+# Pool workers come from a forkserver (spawn where there is none): the pool adds workers on demand
+# while other threads are running, and forking while one of them holds a lock can deadlock the child
+PDF_POOL_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+PDF_EDGE_PAGES = 2  # Pages read from the start (and, if no email there, the end) of each PDF
 
 
 # ----------------------------
 
+FIELDNAMES = ['site', 'year', 'conference', 'track', 'paper_url',
+              'pdf_url', 'email', 'name', 'affiliation']
+
+NO_AUTHORS_ROW = {'email': '', 'name': '', 'affiliation': ''}
+
+# Precompiled patterns used on every page / PDF
+EMAIL_RE = re2.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+VOL_RE = re.compile(r'Vol-(\d{4})')
+NAME_RE = re.compile(r'\b[A-Z][a-z]+\b')
+
+# Index anchors that can be volume links; VOL_RE then does the exact match
+VOL_LINKS_XPATH = etree.XPath("//a[@href][contains(@href, 'Vol-') or contains(., 'Vol-')]")
+
+
+def is_cacheable(response):
+    """Keep PDF bodies out of the HTTP cache (they are large and streamed)."""
+    return 'application/pdf' not in response.headers.get('Content-Type', '').lower()
+
 
 def make_session():
-    """Create a requests session with proper headers."""
-    s = requests.Session()
-    s.headers.update({"User-Agent": USER_AGENT})
+    """Create a pooled keep-alive session with retries and proper headers."""
+    if REQUESTS_CACHE_AVAILABLE:
+        # The index page is revalidated on every run: a conditional GET (If-None-Match /
+        # If-Modified-Since from the stored ETag / Last-Modified) costs a 304 when it hasn't changed
+        index_url = re.compile('^' + re.escape(START_URL) + '$')
+        s = requests_cache.CachedSession(HTTP_CACHE, backend='sqlite', expire_after=CACHE_EXPIRE,
+                                         urls_expire_after={index_url: requests_cache.EXPIRE_IMMEDIATELY},
+                                         allowable_methods=('GET',), cache_control=True,
+                                         filter_fn=is_cacheable)
+    else:
+        s = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5,
+                  status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(['GET', 'HEAD']),
+                  # Hand the last 429/503 back instead of raising, so record_response sees the throttling
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    # Accept-Encoding is left to requests/urllib3, which only offer codecs they can decode
+    s.hooks['response'].append(record_response)
+    s.headers.update({"User-Agent": USER_AGENT,
+                      "Accept": "text/html,application/xhtml+xml,application/pdf;q=0.9,*/*;q=0.8"})
     return s
 
 
-def jitter_sleep():
-    """Sleep with random jitter to be respectful."""
-    time.sleep(DELAY_BASE + random.uniform(0, DELAY_BASE * 0.3))
+def join_url(base, href):
+    """urljoin() with string fast paths for the common href shapes on these pages."""
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('/'):
+        if not href.startswith('//') and (base == SITE_ROOT or base.startswith(SITE_ROOT + '/')):
+            return SITE_ROOT + href
+    elif base.endswith('/') and ':' not in href and not href.startswith(('.', '?', '#')):
+        return base + href
+    return urljoin(base, href)
+
+
+# Per-host pacing state, fed by the session's response hook (see polite_sleep)
+_host_state = {}
+_host_lock = threading.Lock()
+
+
+def retry_after_seconds(value):
+    """Seconds requested by a Retry-After header (delta-seconds or HTTP date); 0 if absent/invalid."""
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def record_response(response, *args, **kwargs):
+    """Session response hook: remember each host's latency and throttling signals."""
+    host = urlparse(response.url).netloc
+    with _host_lock:
+        state = _host_state.setdefault(host, {'latency': 0.0, 'factor': LATENCY_FACTOR, 'retry_after': 0.0})
+        state['from_cache'] = getattr(response, 'from_cache', False)
+        if state['from_cache']:
+            return
+        state['latency'] = response.elapsed.total_seconds()
+        if response.status_code in (429, 503):
+            # Throttled: double the latency multiplier until the host answers normally again
+            state['factor'] = min(state['factor'] * 2, MAX_LATENCY_FACTOR)
+            state['retry_after'] = retry_after_seconds(response.headers.get('Retry-After'))
+        else:
+            state['factor'] = LATENCY_FACTOR
+            state['retry_after'] = 0.0
+
+
+def polite_sleep(url):
+    """Sleep before the next request to ``url``'s host, scaled to how fast that host last answered.
+
+    Waits max(MIN_DELAY, LATENCY_FACTOR x last latency, Retry-After) plus jitter, DELAY_BASE for a
+    host not seen yet, and not at all after a response served from the local HTTP cache.
+    """
+    with _host_lock:
+        state = _host_state.get(urlparse(url).netloc)
+        state = dict(state) if state else None
+    if state is None:
+        delay = DELAY_BASE
+    elif state['from_cache']:
+        return
+    else:
+        delay = max(MIN_DELAY, state['latency'] * state['factor'], state['retry_after'])
+    time.sleep(delay + random.uniform(0, delay * JITTER))
 
 
 def extract_emails_from_text(text):
     """Extract all email addresses from text."""
-    emails = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-    # Clean and deduplicate
-    clean_emails = set()
-    for email in emails:
-        email = email.strip().lower()
-        if '@' in email and '.' in email.split('@')[1]:
-            clean_emails.add(email)
-    return list(clean_emails)
+    # EMAIL_RE already guarantees one '@' and a dotted domain, so lowercasing is all that's left
+    return list({email.lower() for email in EMAIL_RE.findall(text)})
 
 
 def extract_mailto_links(soup):
@@ -83,61 +226,179 @@ def extract_mailto_links(soup):
     return emails
 
 
-def extract_emails_from_pdf_pdfminer(pdf_url, session):
-    """Extract emails from PDF using pdfminer.six."""
-    try:
-        print(f"      Extracting from PDF (pdfminer): {pdf_url}")
-        response = session.get(pdf_url, timeout=REQUEST_TIMEOUT)
+def pdf_cache_path(pdf_url):
+    """Location of ``pdf_url`` in PDF_CACHE_DIR (content-addressed by the URL's SHA-1)."""
+    return os.path.join(PDF_CACHE_DIR, hashlib.sha1(pdf_url.encode('utf-8')).hexdigest() + '.pdf')
+
+
+def download_pdf(pdf_url, session):
+    """Return ``(path, fetched)``: a local copy of the PDF (None on a non-200) and whether it took a request.
+
+    The body is streamed to disk in fixed-size chunks (the parsers need a seekable file and the
+    extraction process pool only needs the path). It is written to a temp file in the cache dir
+    and renamed into place, so an interrupted download never leaves a truncated cached PDF.
+    """
+    pdf_path = pdf_cache_path(pdf_url)
+    if os.path.exists(pdf_path):
+        return pdf_path, False
+
+    with session.get(pdf_url, timeout=REQUEST_TIMEOUT, stream=True) as response:
         if response.status_code != 200:
-            return []
+            return None, True
+        response.raw.decode_content = True
+        os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=PDF_CACHE_DIR, suffix='.part', delete=False) as part_file:
+            try:
+                shutil.copyfileobj(response.raw, part_file)
+            except BaseException:
+                part_file.close()
+                os.remove(part_file.name)
+                raise
+    os.replace(part_file.name, pdf_path)
+    return pdf_path, True
+
+
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+
+def get_pdf_pool():
+    """Lazily create the PDF process pool (paper worker threads share it)."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=PDF_POOL_CONTEXT)
+    return _pdf_pool
+
+
+def extract_on_pool(worker, pdf_url, session):
+    """Fetch a PDF (or reuse the cached copy) and run ``worker(path)`` in the process pool.
+
+    Returns ``(results, fetched)``; ``fetched`` is False when the cached copy was used.
+    """
+    pdf_path, fetched = download_pdf(pdf_url, session)
+    if pdf_path is None:
+        return [], fetched
+    return get_pdf_pool().submit(worker, pdf_path).result(), fetched
+
+
+def extract_head_tail_pdfminer(pdf_file):
+    """Text of the first PDF_EDGE_PAGES pages, plus the last ones when the head has no email.
+
+    Author emails sit in the title block or, failing that, in the closing contact/bio section.
+    """
+    text = extract_text(pdf_file, page_numbers=range(PDF_EDGE_PAGES))
+    if EMAIL_RE.search(text):
+        return text
+
+    pdf_file.seek(0)
+    page_count = sum(1 for _ in PDFPage.get_pages(pdf_file))
+    tail = range(max(PDF_EDGE_PAGES, page_count - PDF_EDGE_PAGES), page_count)
+    if not tail:
+        return text
+    pdf_file.seek(0)
+    return text + extract_text(pdf_file, page_numbers=tail)
+
+
+def pdf_authors_pdfminer(pdf_path):
+    """Process-pool worker: emails and guessed names from a PDF file, via pdfminer.six."""
+    with open(pdf_path, 'rb') as pdf_file:
+        text = extract_head_tail_pdfminer(pdf_file)
+    return guess_authors_from_text(text)
+
+
+def guess_authors_from_text(text):
+    """Emails in ``text``, each with a name guessed from the capitalised words just before it."""
+    # One pass: each match carries its own position, so there's no text.find() rescan per email.
+    # Keyed on the lowercased email; the first occurrence supplies the name.
+    results = {}
+    for match in EMAIL_RE.finditer(text):
+        email = match.group().lower()
+        if email in results:
+            continue
+        start = match.start()
+        # Find capitalized words (likely names) in the 120 chars before the email, without slicing
+        words = NAME_RE.findall(text, max(0, start - 120), start)
+        name = ' '.join(words[-2:])
+        results[email] = {'email': email, 'name': name, 'affiliation': ''}
+    return list(results.values())
+
+
+def pdf_authors_pdfium(pdf_path):
+    """Process-pool worker: emails and guessed names from a PDF file, via PDFium.
+
+    Falls back to pdfminer (when installed) for files PDFium can't open.
+    """
+    try:
+        pdf = pdfium.PdfDocument(pdf_path)
+    except Exception:
+        if PDFMINER_AVAILABLE:
+            return pdf_authors_pdfminer(pdf_path)
+        raise
+    try:
+        page_count = len(pdf)
+
+        def pages_text(numbers):
+            return "\n".join(pdf[i].get_textpage().get_text_range() for i in numbers)
+
+        text = pages_text(range(min(PDF_EDGE_PAGES, page_count)))
+        if not EMAIL_RE.search(text):
+            text += pages_text(range(max(PDF_EDGE_PAGES, page_count - PDF_EDGE_PAGES), page_count))
+    finally:
+        pdf.close()
+    return guess_authors_from_text(text)
+
+
+def pdf_authors_pypdf2(pdf_path):
+    """Process-pool worker: emails from a PDF file, via PyPDF2."""
+    with open(pdf_path, 'rb') as pdf_file:
+        reader = PyPDF2.PdfReader(pdf_file)
+        page_count = len(reader.pages)
+
+        def pages_text(numbers):
+            return "".join(reader.pages[i].extract_text() or "" for i in numbers)
+
+        text = pages_text(range(min(PDF_EDGE_PAGES, page_count)))
+        if not EMAIL_RE.search(text):
+            text += pages_text(range(max(PDF_EDGE_PAGES, page_count - PDF_EDGE_PAGES), page_count))
+
+    return [{'email': email, 'name': '', 'affiliation': ''} for email in extract_emails_from_text(text)]
 
-        text = extract_text(BytesIO(response.content))
-        emails = extract_emails_from_text(text)
-
-        # Try to guess author names near emails
-        results = []
-        for email in emails:
-            idx = text.find(email)
-            name = ''
-            if idx > 0:
-                # Get text before email
-                snippet = text[max(0, idx - 120):idx]
-                # Find capitalized words (likely names)
-                words = re.findall(r'\b[A-Z][a-z]+\b', snippet)
-                if words:
-                    name = ' '.join(words[-2:]) if len(words) >= 2 else words[-1]
-            results.append({'email': email, 'name': name, 'affiliation': ''})
 
+def extract_emails_from_pdf_pdfium(pdf_url, session):
+    """Extract emails from PDF using pypdfium2; returns ``(results, fetched)`` like extract_on_pool()."""
+    try:
+        print(f"      Extracting from PDF (PDFium): {pdf_url}")
+        results, fetched = extract_on_pool(pdf_authors_pdfium, pdf_url, session)
         print(f"      Found {len(results)} emails in PDF")
-        return results
+        return results, fetched
     except Exception as e:
         print(f"      Error extracting from PDF: {e}")
-        return []
+        return [], True  # the request may have gone out; stay polite
 
 
-def extract_emails_from_pdf_pypdf2(pdf_url, session):
-    """Extract emails from PDF using PyPDF2."""
+def extract_emails_from_pdf_pdfminer(pdf_url, session):
+    """Extract emails from PDF using pdfminer.six; returns ``(results, fetched)`` like extract_on_pool()."""
     try:
-        print(f"      Extracting from PDF (PyPDF2): {pdf_url}")
-        response = session.get(pdf_url, timeout=REQUEST_TIMEOUT)
-        if response.status_code != 200:
-            return []
-
-        reader = PyPDF2.PdfReader(BytesIO(response.content))
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() or ""
+        print(f"      Extracting from PDF (pdfminer): {pdf_url}")
+        results, fetched = extract_on_pool(pdf_authors_pdfminer, pdf_url, session)
+        print(f"      Found {len(results)} emails in PDF")
+        return results, fetched
+    except Exception as e:
+        print(f"      Error extracting from PDF: {e}")
+        return [], True  # the request may have gone out; stay polite
 
-        emails = extract_emails_from_text(text)
-        results = []
-        for email in emails:
-            results.append({'email': email, 'name': '', 'affiliation': ''})
 
+def extract_emails_from_pdf_pypdf2(pdf_url, session):
+    """Extract emails from PDF using PyPDF2; returns ``(results, fetched)`` like extract_on_pool()."""
+    try:
+        print(f"      Extracting from PDF (PyPDF2): {pdf_url}")
+        results, fetched = extract_on_pool(pdf_authors_pypdf2, pdf_url, session)
         print(f"      Found {len(results)} emails in PDF")
-        return results
+        return results, fetched
     except Exception as e:
         print(f"      Error extracting from PDF: {e}")
-        return []
+        return [], True  # the request may have gone out; stay polite
 
 
 def discover_volumes(session, max_volumes=None):
@@ -153,40 +414,39 @@ def discover_volumes(session, max_volumes=None):
         print(f"Error fetching main page: {e}")
         return []
 
-    soup = BeautifulSoup(response.content, 'html.parser')
-    volumes = []
+    # The index is one big list of anchors; lxml XPath pre-filters them in C
+    try:
+        tree = lxml.html.fromstring(response.content)
+    except (etree.ParserError, etree.ParseError, ValueError) as e:
+        print(f"Main page is empty or unparseable: {e}")
+        return []
+    # Keyed by volume number: the first link seen for a volume wins (dedupe in the same pass)
+    by_volume = {}
 
     # CEUR lists volumes with "Vol-XXXX" pattern
-    for a in soup.find_all('a', href=True):
-        href = a['href']
-        text = a.get_text()
+    for a in VOL_LINKS_XPATH(tree):
+        href = a.get('href')
+        text = a.text_content()
 
         # Look for volume links like "Vol-4120" or "Vol-4119"
-        if re.search(r'Vol-\d{4}', text) or re.search(r'Vol-\d{4}', href):
-            vol_match = re.search(r'Vol-(\d{4})', text + href)
+        if VOL_RE.search(text) or VOL_RE.search(href):
+            vol_match = VOL_RE.search(text + href)
             if vol_match:
                 vol_num = vol_match.group(1)
-                vol_url = urljoin(START_URL, href)
+                if vol_num in by_volume:
+                    continue
 
                 # Get workshop title if available
                 title = text if text and 'Vol-' not in text else f"Volume {vol_num}"
 
-                volumes.append({
+                by_volume[vol_num] = {
                     'volume': vol_num,
-                    'url': vol_url,
+                    'url': join_url(START_URL, href),
                     'title': title
-                })
-
-    # Remove duplicates based on volume number
-    seen = set()
-    unique_volumes = []
-    for vol in volumes:
-        if vol['volume'] not in seen:
-            seen.add(vol['volume'])
-            unique_volumes.append(vol)
+                }
 
     # Sort by volume number (descending - newest first)
-    unique_volumes.sort(key=lambda x: int(x['volume']), reverse=True)
+    unique_volumes = sorted(by_volume.values(), key=lambda x: int(x['volume']), reverse=True)
 
     if max_volumes:
         unique_volumes = unique_volumes[:max_volumes]
@@ -213,11 +473,11 @@ def scrape_volume(session, volume_info, max_papers=None):
         print(f"  Error fetching volume: {e}")
         return []
 
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = BeautifulSoup(response.content, 'lxml')
     results = []
 
     # Extract year from page
-    year_match = re.search(r'\b(19\d{2}|20\d{2})\b', soup.get_text())
+    year_match = YEAR_RE.search(soup.get_text())
     year = year_match.group(1) if year_match else "Unknown"
 
     # Find all paper links (PDFs)
@@ -225,7 +485,7 @@ def scrape_volume(session, volume_info, max_papers=None):
     for a in soup.find_all('a', href=True):
         href = a['href']
         if href.endswith('.pdf'):
-            paper_url = urljoin(vol_url, href)
+            paper_url = join_url(vol_url, href)
             paper_title = a.get_text(strip=True)
             paper_links.append({'url': paper_url, 'title': paper_title})
 
@@ -238,69 +498,56 @@ def scrape_volume(session, volume_info, max_papers=None):
 
     print(f"  Found {len(paper_links)} papers")
 
-    # Process each paper
-    for idx, paper in enumerate(paper_links, 1):
-        print(f"    [{idx}/{len(paper_links)}] {paper['title'][:60]}...")
-
-        # Try to extract emails from PDF
-        authors = []
-
-        if PDFMINER_AVAILABLE:
-            authors = extract_emails_from_pdf_pdfminer(paper['url'], session)
-        elif PYPDF2_AVAILABLE:
-            authors = extract_emails_from_pdf_pypdf2(paper['url'], session)
-
-        if authors:
-            for author in authors:
-                results.append({
-                    'site': SITE_NAME,
-                    'year': year,
-                    'conference': vol_title,
-                    'track': f"Vol-{vol_num}",
-                    'paper_url': paper['url'],
-                    'pdf_url': paper['url'],
-                    'email': author['email'],
-                    'name': author['name'],
-                    'affiliation': author.get('affiliation', '')
-                })
-        else:
-            # No emails found - record paper anyway
-            results.append({
-                'site': SITE_NAME,
-                'year': year,
-                'conference': vol_title,
-                'track': f"Vol-{vol_num}",
-                'paper_url': paper['url'],
-                'pdf_url': paper['url'],
-                'email': '',
-                'name': '',
-                'affiliation': ''
-            })
-
-        jitter_sleep()
+    # Process papers with a small thread pool; each worker sleeps between its own requests
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [pool.submit(scrape_paper, session, paper, idx, len(paper_links), year, vol_num, vol_title)
+                   for idx, paper in enumerate(paper_links, 1)]
+        try:
+            for future in futures:
+                results.extend(future.result())
+        except BaseException:
+            # Ctrl-C (or a failed paper): drop the queued papers instead of draining them on exit
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
 
     print(f"  Vol-{vol_num} complete: {len([r for r in results if r['email']])} emails found")
     return results
 
 
-def write_csv_header():
-    """Write CSV header if file doesn't exist."""
-    if not os.path.exists(OUTPUT_CSV):
-        with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['site', 'year', 'conference', 'track', 'paper_url',
-                             'pdf_url', 'email', 'name', 'affiliation'])
+def scrape_paper(session, paper, idx, total, year, vol_num, vol_title):
+    """Worker task: extract author emails from one paper PDF and return its CSV rows."""
+    print(f"    [{idx}/{total}] {paper['title'][:60]}...")
+    results = []
 
+    # Try to extract emails from PDF
+    authors, fetched = [], False
+
+    if PDFIUM_AVAILABLE:
+        authors, fetched = extract_emails_from_pdf_pdfium(paper['url'], session)
+    elif PDFMINER_AVAILABLE:
+        authors, fetched = extract_emails_from_pdf_pdfminer(paper['url'], session)
+    elif PYPDF2_AVAILABLE:
+        authors, fetched = extract_emails_from_pdf_pypdf2(paper['url'], session)
+
+    base = {
+        'site': SITE_NAME,
+        'year': year,
+        'conference': vol_title,
+        'track': f"Vol-{vol_num}",
+        'paper_url': paper['url'],
+        'pdf_url': paper['url'],
+    }
+    # No emails found - record paper anyway
+    for author in authors or [NO_AUTHORS_ROW]:
+        row = base.copy()
+        row.update(author)
+        results.append(row)
+
+    # A PDF served from PDF_CACHE_DIR made no request, so there is nothing to pace
+    if fetched:
+        polite_sleep(paper['url'])
 
-def append_results(results):
-    """Append results to CSV file."""
-    with open(OUTPUT_CSV, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        for r in results:
-            writer.writerow([
-                r['site'], r['year'], r['conference'], r['track'],
-                r['paper_url'], r['pdf_url'], r['email'], r['name'], r['affiliation']
-            ])
+    return results
 
 
 def main():
@@ -309,52 +556,77 @@ def main():
     print("CEUR Workshop Proceedings Scraper")
     print("=" * 60)
     print(
-        f"PDF extraction available: pdfminer={PDFMINER_AVAILABLE}, PyPDF2={PYPDF2_AVAILABLE if not PDFMINER_AVAILABLE else 'N/A'}")
+        f"PDF extraction available: PDFium={PDFIUM_AVAILABLE}, pdfminer={PDFMINER_AVAILABLE}, PyPDF2={PYPDF2_AVAILABLE if not PDFMINER_AVAILABLE else 'N/A'}")
     print()
 
-    # Clear old results
-    if os.path.exists(OUTPUT_CSV):
-        os.remove(OUTPUT_CSV)
-        print(f"Cleared previous {OUTPUT_CSV}")
-
-    write_csv_header()
-
-    session = make_session()
-
-    # Discover all volumes
-    volumes = discover_volumes(session, max_volumes=MAX_VOLUMES)
-
-    if not volumes:
-        print("No volumes found!")
-        return
-
-    print(f"\nStarting to scrape {len(volumes)} volumes...")
-
-    total_emails = 0
-
+    # One handle for the whole run; each batch goes out in a single writerows(). Rows go to a
+    # .part file that replaces OUTPUT_CSV when the run ends (also on Ctrl-C), so a crash
+    # leaves the previous results untouched. A run that saved no rows (nothing discovered, every
+    # volume came back empty, or it was interrupted first) never replaces it.
+    part_path = OUTPUT_CSV + '.part'
+    volumes_saved = 0  # volumes that wrote at least one row
+    f = open(part_path, 'w', newline='', encoding='utf-8')
     try:
-        for idx, vol_info in enumerate(volumes, 1):
-            print(f"\n[{idx}/{len(volumes)}]")
-            results = scrape_volume(session, vol_info, max_papers=MAX_PAPERS_PER_VOLUME)
-
-            if results:
-                append_results(results)
-                emails_found = len([r for r in results if r['email']])
-                total_emails += emails_found
-                print(f"  Saved {emails_found} emails from this volume")
-
-            jitter_sleep()
-
-    except KeyboardInterrupt:
-        print("\n\nKeyboardInterrupt - Stopping gracefully...")
-        print(f"Partial results saved to: {OUTPUT_CSV}")
-        return
-
-    print("\n" + "=" * 60)
-    print("SCRAPING COMPLETE")
-    print("=" * 60)
-    print(f"Total emails extracted: {total_emails}")
-    print(f"Results saved to: {os.path.abspath(OUTPUT_CSV)}")
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+
+        session = make_session()
+
+        # Discover all volumes
+        volumes = discover_volumes(session, max_volumes=MAX_VOLUMES)
+
+        if not volumes:
+            print("No volumes found!")
+            return
+
+        print(f"\nStarting to scrape {len(volumes)} volumes...")
+
+        total_emails = 0
+
+        try:
+            for idx, vol_info in enumerate(volumes, 1):
+                print(f"\n[{idx}/{len(volumes)}]")
+                results = scrape_volume(session, vol_info, max_papers=MAX_PAPERS_PER_VOLUME)
+
+                if results:
+                    writer.writerows(results)
+                    f.flush()  # keep partial results on disk
+                    emails_found = len([r for r in results if r['email']])
+                    total_emails += emails_found
+                    print(f"  Saved {emails_found} emails from this volume")
+                    volumes_saved += 1
+
+                polite_sleep(vol_info['url'])
+
+        except KeyboardInterrupt:
+            print("\n\nKeyboardInterrupt - Stopping gracefully...")
+            if volumes_saved:
+                print(f"Partial results saved to: {OUTPUT_CSV}")
+            return
+
+        print("\n" + "=" * 60)
+        print("SCRAPING COMPLETE")
+        print("=" * 60)
+        print(f"Total emails extracted: {total_emails}")
+        if volumes_saved:
+            print(f"Results saved to: {os.path.abspath(OUTPUT_CSV)}")
+
+    except Exception:
+        f.close()
+        if volumes_saved:
+            print(f"Run failed; previous {OUTPUT_CSV} left untouched, partial output in {part_path}")
+        else:
+            os.remove(part_path)
+            print(f"Run failed; previous {OUTPUT_CSV} left untouched")
+        raise
+    finally:
+        if not f.closed:
+            f.close()
+            if volumes_saved:
+                os.replace(part_path, OUTPUT_CSV)
+            else:
+                os.remove(part_path)
+                print(f"Nothing scraped; previous {OUTPUT_CSV} left untouched")
 
 
 if __name__ == "__main__":
@@ -6,19 +6,28 @@ Output: swj_all_papers.csv
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 import re
 import csv
 import time
-import random
 import os
+import threading
+from collections import OrderedDict
+from datetime import timedelta
 from urllib.parse import urljoin
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Try to import PDF parsing library
 try:
     from pdfminer.high_level import extract_text
+    from pdfminer.layout import LAParams
 
+    # Keep word/line detection, skip only the text-box ordering pass
+    PDFMINER_LAPARAMS = LAParams(boxes_flow=None)
     PDFMINER_AVAILABLE = True
 except ImportError:
     try:
@@ -27,8 +36,29 @@ except ImportError:
         PDFMINER_AVAILABLE = False
         PYPDF2_AVAILABLE = True
     except ImportError:
+        PDFMINER_AVAILABLE = False
         PYPDF2_AVAILABLE = False
 
+# PDFium bindings are much faster than pdfminer; preferred when installed
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+# Optional linear-time regex engine for the bulk email scans
+try:
+    import re2
+except ImportError:
+    re2 = re
+
+# Optional persistent HTTP cache; reruns skip re-downloading year/paper pages and PDFs
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
 # ---------- CONFIG ----------
 START_URL = "https://www.semantic-web-journal.net/issues"
 SITE_NAME = "Semantic Web Journal"
@@ -36,77 +66,257 @@ OUTPUT_CSV = "swj_all_papers.csv"
 
 USER_AGENT = "SWJ-Scraper/1.0"
 REQUEST_TIMEOUT = 15
-DELAY_BASE = 1.0
+REQUESTS_PER_SECOND = 0.85  # Sustained request rate to the site, shared by all worker threads (~1 per 1.15 s)
+REQUEST_BURST = 1  # No back-to-back requests, even after an idle spell
+PDF_MEMO_SIZE = 256  # Recent PDF URLs whose extraction results are reused within a run
+MAX_PDF_BYTES = 8 * 1024 * 1024  # Larger PDFs are skipped rather than handed to the PDF parser
+HTTP_CACHE = "swj_http_cache"  # requests-cache SQLite file for pages and PDFs
+CACHE_EXPIRE = timedelta(days=7)  # lifetime of cached year/paper pages
 
 # Testing limits
 MAX_YEARS = None  # Set to number for testing (e.g., 2)
 MAX_PAPERS_PER_YEAR = None  # Set to number for testing (e.g., 3)
+MAX_WORKERS = 4  # Concurrent paper-page fetches per year
+PDF_WORKERS = 8  # Concurrent PDF downloads/extractions, run after a year's paper pages
 
 
 # ----------------------------
 
+FIELDNAMES = ['site', 'year', 'conference', 'track', 'paper_url',
+              'pdf_url', 'email', 'name', 'affiliation']
+
+# Precompiled patterns used on every page
+EMAIL_RE = re2.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+NAME_RE = re.compile(r'\b[A-Z][a-z]+\b')
+AUTHOR_SPLIT_RE = re.compile(r'[,;]|\band\b')
+ISSUES_YEAR_RE = re.compile(r'Issues in (\d{4})')
+
+# Link and author filters, compiled once and evaluated by lxml in C
+YEAR_LINKS_XPATH = etree.XPath("//a[@href][contains(., 'Issues in')]")
+CONTENT_LINKS_XPATH = etree.XPath(
+    "//a[contains(@href, '/content/') and not(substring(@href, string-length(@href) - 3) = '.pdf')]")
+PDF_HREF_XPATH = etree.XPath(
+    "(//a[contains(translate(@href, 'PDF', 'pdf'), '.pdf')"
+    " or contains(translate(@href, 'DOWNLOAD', 'download'), 'download')])[1]/@href")
+AUTHOR_SECTION_XPATH = etree.XPath(
+    "(//div[contains(concat(' ', normalize-space(@class), ' '), ' field-name-field-authors ')])[1]")
+AUTHOR_DIVS_XPATH = etree.XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' author ')]")
+# Inside the authors field: one element per author, as links or as Drupal field items
+AUTHOR_LINKS_XPATH = etree.XPath(".//a")
+AUTHOR_ITEMS_XPATH = etree.XPath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' field-item ')]")
+
+
+def is_cacheable(response):
+    """Cache HTML freely; PDFs only with a Content-Length within MAX_PDF_BYTES.
+
+    Storing a response reads its whole body, which would bypass fetch_pdf_bytes()'s size cap.
+    """
+    if 'application/pdf' not in response.headers.get('Content-Type', '').lower():
+        return True
+    length = response.headers.get('Content-Length', '')
+    return length.isdigit() and int(length) <= MAX_PDF_BYTES
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until the caller may send a request."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Take the token now (possibly going negative) so waiters are served in arrival order
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a token from a shared bucket before each request goes on the wire.
+
+    Cache hits never reach the adapter, so they are not throttled.
+    """
+
+    def __init__(self, bucket, *args, **kwargs):
+        self.bucket = bucket
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        self.bucket.acquire()
+        return super().send(request, **kwargs)
+
 
 def make_session():
-    """Create a requests session with proper headers."""
-    s = requests.Session()
-    s.headers.update({"User-Agent": USER_AGENT})
+    """Create a pooled keep-alive session with retries and proper headers."""
+    if REQUESTS_CACHE_AVAILABLE:
+        # PDFs never change once published, so they are kept indefinitely
+        pdf_urls = re.compile(r'\.pdf$', re.IGNORECASE)
+        s = requests_cache.CachedSession(HTTP_CACHE, backend='sqlite', expire_after=CACHE_EXPIRE,
+                                         urls_expire_after={pdf_urls: requests_cache.NEVER_EXPIRE},
+                                         allowable_methods=('GET',), stale_if_error=True,
+                                         filter_fn=is_cacheable)
+    else:
+        s = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5,
+                  status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(['GET', 'HEAD']))
+    # One bucket for both schemes: the politeness budget is per site, not per worker
+    adapter = RateLimitedAdapter(TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST),
+                                 pool_connections=32, pool_maxsize=64, max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    # Accept-Encoding is left to requests/urllib3, which only offer codecs they can decode
+    s.headers.update({"User-Agent": USER_AGENT, "Connection": "keep-alive"})
     return s
 
 
-def jitter_sleep():
-    """Sleep with random jitter to be respectful."""
-    time.sleep(DELAY_BASE + random.uniform(0, DELAY_BASE * 0.3))
+def get_index_page(session, url):
+    """GET an issues/year index page, revalidating any cached copy on every run.
+
+    With the HTTP cache the stored ETag / Last-Modified go out as If-None-Match /
+    If-Modified-Since, so an unchanged index costs a 304 and is served from the cache.
+    """
+    if REQUESTS_CACHE_AVAILABLE:
+        return session.get(url, timeout=REQUEST_TIMEOUT, stream=True,
+                           expire_after=requests_cache.EXPIRE_IMMEDIATELY)
+    return session.get(url, timeout=REQUEST_TIMEOUT, stream=True)
+
+
+def parse_html(response):
+    """Parse a streamed HTML response with lxml, feeding it the body straight off the connection.
+
+    Without the HTTP cache this skips building ``response.content`` (and the copy lxml would make
+    of it); the CachedSession has already buffered the body to store it, so that is parsed instead.
+    Returns None for an empty or unparseable body, so one bad page can't abort the run.
+    """
+    with response:
+        try:
+            if REQUESTS_CACHE_AVAILABLE:
+                return lxml.html.fromstring(response.content)
+            response.raw.decode_content = True
+            return lxml.html.parse(response.raw).getroot()
+        except (etree.ParserError, etree.ParseError, ValueError):
+            return None
+
+
+def stripped_text(el):
+    """lxml counterpart of BeautifulSoup's get_text(strip=True)."""
+    return "".join(t.strip() for t in el.itertext())
 
 
 def extract_emails_from_text(text):
     """Extract all email addresses from text."""
-    emails = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-    clean_emails = set()
-    for email in emails:
-        email = email.strip().lower()
-        if '@' in email and '.' in email.split('@')[1]:
-            clean_emails.add(email)
-    return list(clean_emails)
+    # Most page and PDF texts have no address at all; the C substring test skips the regex scan
+    if '@' not in text:
+        return []
+    # EMAIL_RE already guarantees one '@' and a dotted domain, so lowercasing is all that's left
+    return list({m.group(0).lower() for m in EMAIL_RE.finditer(text)})
+
+
+def fetch_pdf_bytes(pdf_url, session):
+    """Stream a PDF body, capped at MAX_PDF_BYTES; None on a non-200 or an oversized PDF.
+
+    A too-large Content-Length is rejected before any of the body is read; without the header the
+    read itself stops one byte past the cap (a truncated PDF is not parseable anyway).
+    """
+    with session.get(pdf_url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+        if response.status_code != 200:
+            return None
+        length = response.headers.get('Content-Length', '')
+        if length.isdigit() and int(length) > MAX_PDF_BYTES:
+            print(f"        Skipping PDF over {MAX_PDF_BYTES // (1024 * 1024)} MB ({length} bytes)")
+            return None
+        response.raw.decode_content = True
+        data = response.raw.read(MAX_PDF_BYTES + 1)
+    if len(data) > MAX_PDF_BYTES:
+        print(f"        Skipping PDF over {MAX_PDF_BYTES // (1024 * 1024)} MB")
+        return None
+    return data
+
+
+def guess_authors_from_text(text):
+    """Emails in PDF text, each with a name guessed from the capitalised words just before it."""
+    if '@' not in text:
+        return []
+    # One pass: each match carries its own position, so there's no text.find() rescan per email.
+    # Keyed on the lowercased email; the first occurrence supplies the name.
+    results = {}
+    for match in EMAIL_RE.finditer(text):
+        email = match.group().lower()
+        if email in results:
+            continue
+        start = match.start()
+        # Capitalized words (likely names) in the 120 chars before the email, without slicing
+        words = NAME_RE.findall(text, max(0, start - 120), start)
+        name = ' '.join(words[-2:])
+        results[email] = {'email': email, 'name': name, 'affiliation': ''}
+    return list(results.values())
+
+
+# PDFium is not thread-safe; paper worker threads take turns on it
+_pdfium_lock = threading.Lock()
+
+
+def extract_emails_from_pdf_pdfium(pdf_url, session):
+    """Extract emails from PDF using pypdfium2."""
+    try:
+        print(f"        Extracting from PDF (PDFium): {pdf_url}")
+        data = fetch_pdf_bytes(pdf_url, session)
+        if data is None:
+            return None
+
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(data)
+            try:
+                text = "\n".join(page.get_textpage().get_text_range() for page in pdf)
+            finally:
+                pdf.close()
+        results = guess_authors_from_text(text)
+
+        print(f"        Found {len(results)} emails in PDF")
+        return results
+    except Exception as e:
+        print(f"        Error extracting from PDF: {e}")
+        return None
 
 
 def extract_emails_from_pdf_pdfminer(pdf_url, session):
     """Extract emails from PDF using pdfminer.six."""
     try:
         print(f"        Extracting from PDF (pdfminer): {pdf_url}")
-        response = session.get(pdf_url, timeout=REQUEST_TIMEOUT)
-        if response.status_code != 200:
-            return []
-
-        text = extract_text(BytesIO(response.content))
-        emails = extract_emails_from_text(text)
+        data = fetch_pdf_bytes(pdf_url, session)
+        if data is None:
+            return None
 
-        results = []
-        for email in emails:
-            idx = text.find(email)
-            name = ''
-            if idx > 0:
-                snippet = text[max(0, idx - 120):idx]
-                words = re.findall(r'\b[A-Z][a-z]+\b', snippet)
-                if words:
-                    name = ' '.join(words[-2:]) if len(words) >= 2 else words[-1]
-            results.append({'email': email, 'name': name, 'affiliation': ''})
+        # Word and line detection stay on (without them emails run into the neighbouring words);
+        # boxes_flow=None only skips the costly text-box ordering pass
+        text = extract_text(BytesIO(data), laparams=PDFMINER_LAPARAMS)
+        results = guess_authors_from_text(text)
 
         print(f"        Found {len(results)} emails in PDF")
         return results
     except Exception as e:
         print(f"        Error extracting from PDF: {e}")
-        return []
+        return None
 
 
 def extract_emails_from_pdf_pypdf2(pdf_url, session):
     """Extract emails from PDF using PyPDF2."""
     try:
         print(f"        Extracting from PDF (PyPDF2): {pdf_url}")
-        response = session.get(pdf_url, timeout=REQUEST_TIMEOUT)
-        if response.status_code != 200:
-            return []
+        data = fetch_pdf_bytes(pdf_url, session)
+        if data is None:
+            return None
 
-        reader = PyPDF2.PdfReader(BytesIO(response.content))
+        reader = PyPDF2.PdfReader(BytesIO(data))
         text = ""
         for page in reader.pages:
             text += page.extract_text() or ""
@@ -120,7 +330,43 @@ def extract_emails_from_pdf_pypdf2(pdf_url, session):
         return results
     except Exception as e:
         print(f"        Error extracting from PDF: {e}")
+        return None
+
+
+# Successful PDF extractions by URL, most recently used last (see extract_emails_from_pdf)
+_pdf_memo = OrderedDict()
+_pdf_memo_lock = threading.Lock()
+
+
+def extract_emails_from_pdf(pdf_url, session):
+    """Extract emails from PDF with the fastest installed backend.
+
+    Memoised per URL (the PDF_MEMO_SIZE most recent): SWJ links some manuscripts from several
+    paper pages, and a repeat in a later year is neither downloaded nor parsed again. The
+    backends return None when a fetch or parse fails; that is not memoised, so a repeat retries.
+    Callers must treat the returned rows as read-only.
+    """
+    with _pdf_memo_lock:
+        if pdf_url in _pdf_memo:
+            _pdf_memo.move_to_end(pdf_url)
+            return _pdf_memo[pdf_url]
+
+    if PDFIUM_AVAILABLE:
+        results = extract_emails_from_pdf_pdfium(pdf_url, session)
+    elif PDFMINER_AVAILABLE:
+        results = extract_emails_from_pdf_pdfminer(pdf_url, session)
+    elif PYPDF2_AVAILABLE:
+        results = extract_emails_from_pdf_pypdf2(pdf_url, session)
+    else:
         return []
+    if results is None:
+        return []
+
+    with _pdf_memo_lock:
+        _pdf_memo[pdf_url] = results
+        if len(_pdf_memo) > PDF_MEMO_SIZE:
+            _pdf_memo.popitem(last=False)
+    return results
 
 
 def discover_year_issues(session, max_years=None):
@@ -128,25 +374,29 @@ def discover_year_issues(session, max_years=None):
     print(f"Discovering issues from: {START_URL}")
 
     try:
-        response = session.get(START_URL, timeout=REQUEST_TIMEOUT)
+        response = get_index_page(session, START_URL)
         if response.status_code != 200:
             print(f"Failed to fetch issues page: {response.status_code}")
+            response.close()
             return []
     except Exception as e:
         print(f"Error fetching issues page: {e}")
         return []
 
-    soup = BeautifulSoup(response.content, 'html.parser')
+    tree = parse_html(response)
+    if tree is None:
+        print("Issues page is empty or unparseable")
+        return []
     year_links = []
 
-    # Find all year links (Issues in 2025, Issues in 2024, etc.)
-    for a in soup.find_all('a', href=True):
-        text = a.get_text(strip=True)
+    # Find all year links (Issues in 2025, Issues in 2024, etc.); the XPath pre-filters the anchors in C
+    for a in YEAR_LINKS_XPATH(tree):
+        text = stripped_text(a)
         # Pattern: "Issues in 2025", "Issues in 2024"
-        match = re.search(r'Issues in (\d{4})', text)
+        match = ISSUES_YEAR_RE.search(text)
         if match:
             year = match.group(1)
-            year_url = urljoin(START_URL, a['href'])
+            year_url = urljoin(START_URL, a.get('href'))
             year_links.append({
                 'year': year,
                 'url': year_url,
@@ -170,38 +420,45 @@ def discover_year_issues(session, max_years=None):
     return unique_years
 
 
-def scrape_year_papers(session, year_info, max_papers=None):
-    """Scrape all papers from a specific year."""
+def scrape_year_papers(session, year_info, pdf_pool, max_papers=None):
+    """Scrape all papers from a specific year.
+
+    Paper pages are fetched first; the PDFs of papers whose page shows no email are then
+    submitted to ``pdf_pool`` in one batch. Rows are emitted in paper order either way.
+    """
     year = year_info['year']
     year_url = year_info['url']
 
     print(f"\nScraping {year}: {year_url}")
 
     try:
-        response = session.get(year_url, timeout=REQUEST_TIMEOUT)
+        response = get_index_page(session, year_url)
         if response.status_code != 200:
             print(f"  Failed to fetch year page: {response.status_code}")
+            response.close()
             return []
     except Exception as e:
         print(f"  Error fetching year page: {e}")
         return []
 
-    soup = BeautifulSoup(response.content, 'html.parser')
+    tree = parse_html(response)
+    if tree is None:
+        print("  Year page is empty or unparseable")
+        return []
     results = []
 
     # Find all paper links - they contain article titles and lead to individual paper pages
     paper_links = []
+    seen_urls = set()
 
-    # Look for links that lead to /content/ pages (individual papers)
-    for a in soup.find_all('a', href=True):
-        href = a['href']
-        if '/content/' in href and not href.endswith('.pdf'):
-            paper_url = urljoin(year_url, href)
-            paper_title = a.get_text(strip=True)
+    # Links that lead to /content/ pages (individual papers), PDFs already excluded by the XPath
+    for a in CONTENT_LINKS_XPATH(tree):
+        paper_url = urljoin(year_url, a.get('href'))
 
-            # Avoid duplicate links
-            if paper_url not in [p['url'] for p in paper_links]:
-                paper_links.append({'url': paper_url, 'title': paper_title})
+        # Avoid duplicate links
+        if paper_url not in seen_urls:
+            seen_urls.add(paper_url)
+            paper_links.append({'url': paper_url, 'title': stripped_text(a)})
 
     if not paper_links:
         print(f"  No papers found for {year}")
@@ -212,182 +469,165 @@ def scrape_year_papers(session, year_info, max_papers=None):
 
     print(f"  Found {len(paper_links)} papers")
 
-    # Process each paper
-    for idx, paper in enumerate(paper_links, 1):
-        print(f"    [{idx}/{len(paper_links)}] {paper['title'][:60]}...")
-
-        # Visit individual paper page to get author info
-        paper_results = scrape_paper_page(session, paper['url'], year)
-        results.extend(paper_results)
-
-        jitter_sleep()
+    # Process papers with a small thread pool; the session's rate limiter paces their requests
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [pool.submit(scrape_paper, session, paper, idx, len(paper_links))
+                   for idx, paper in enumerate(paper_links, 1)]
+        try:
+            pages = [future.result() for future in futures]
+        except BaseException:
+            # Ctrl-C (or a failed paper): drop the queued papers instead of draining them on exit
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    # PDF fallback for papers with no email on their page, all submitted up front; one job per
+    # distinct PDF, its rows fanned out to every paper linking it
+    pdf_papers = {}
+    for idx, page in enumerate(pages):
+        if page and not page['emails'] and page['pdf_url']:
+            pdf_papers.setdefault(page['pdf_url'], []).append(idx)
+    pdf_futures = {pdf_pool.submit(extract_emails_from_pdf, pdf_url, session): pdf_url
+                   for pdf_url in pdf_papers}
+    pdf_authors = {}
+    try:
+        for future in as_completed(pdf_futures):
+            rows = future.result()
+            for idx in pdf_papers[pdf_futures[future]]:
+                pdf_authors[idx] = rows
+    except BaseException:
+        # pdf_pool outlives this year, so only this year's jobs that haven't started are dropped
+        for future in pdf_futures:
+            future.cancel()
+        raise
+
+    for idx, page in enumerate(pages):
+        if page:
+            results.extend(paper_rows(page, year, pdf_authors.get(idx)))
 
     print(f"  {year} complete: {len([r for r in results if r['email']])} emails found")
     return results
 
 
-def scrape_paper_page(session, paper_url, year):
-    """Scrape individual paper page for author information."""
+def scrape_paper(session, paper, idx, total):
+    """Worker task: visit one paper page and return what scrape_paper_page found on it."""
+    print(f"    [{idx}/{total}] {paper['title'][:60]}...")
+
+    # Visit individual paper page to get author info
+    return scrape_paper_page(session, paper['url'])
+
+
+def scrape_paper_page(session, paper_url):
+    """Scrape individual paper page for author information; None if the page can't be fetched.
+
+    Returns the page's author names, PDF link and on-page emails; paper_rows() turns them
+    into CSV rows once any PDF fallback has run.
+    """
     try:
-        response = session.get(paper_url, timeout=REQUEST_TIMEOUT)
+        response = session.get(paper_url, timeout=REQUEST_TIMEOUT, stream=True)
         if response.status_code != 200:
             print(f"      Failed to fetch paper page: {response.status_code}")
-            return []
+            response.close()
+            return None
     except Exception as e:
         print(f"      Error fetching paper page: {e}")
-        return []
+        return None
 
-    soup = BeautifulSoup(response.content, 'html.parser')
-    results = []
+    tree = parse_html(response)
+    if tree is None:
+        print("      Paper page is empty or unparseable")
+        return None
 
     # Extract paper title
-    title_tag = soup.find('h1') or soup.find('title')
-    paper_title = title_tag.get_text(strip=True) if title_tag else "Unknown Title"
+    title_tag = tree.find('.//h1')
+    if title_tag is None:
+        title_tag = tree.find('.//title')
+    paper_title = stripped_text(title_tag) if title_tag is not None else "Unknown Title"
 
     # Extract authors from the page - they're listed with names
     authors = []
-    author_section = soup.find('div', class_='field-name-field-authors') or soup.find_all('div', class_='author')
-
-    if author_section:
-        # Find all author names in the author section
-        if isinstance(author_section, list):
-            for auth_div in author_section:
-                name = auth_div.get_text(strip=True)
-                if name:
-                    authors.append({'name': name, 'email': '', 'affiliation': ''})
+    author_section = AUTHOR_SECTION_XPATH(tree)
+    author_divs = AUTHOR_DIVS_XPATH(tree) if not author_section else []
+
+    # Find all author names in the author section
+    if author_divs:
+        for auth_div in author_divs:
+            name = stripped_text(auth_div)
+            if name:
+                authors.append({'name': name, 'email': '', 'affiliation': ''})
+    elif author_section:
+        section = author_section[0]
+        # One element per author when the markup has them; a lone element may still hold a list
+        name_nodes = AUTHOR_LINKS_XPATH(section) or AUTHOR_ITEMS_XPATH(section)
+        if len(name_nodes) > 1:
+            author_names = [stripped_text(node) for node in name_nodes]
         else:
-            author_text = author_section.get_text()
             # Split by common separators
-            author_names = re.split(r'[,;]|\band\b', author_text)
-            for name in author_names:
-                name = name.strip()
-                if name and len(name) > 2:
-                    authors.append({'name': name, 'email': '', 'affiliation': ''})
+            author_names = AUTHOR_SPLIT_RE.split(section.text_content())
+        for name in author_names:
+            name = name.strip()
+            if name and len(name) > 2:
+                authors.append({'name': name, 'email': '', 'affiliation': ''})
 
-    # Find PDF link
+    # Find PDF link (first anchor whose href mentions .pdf or download)
     pdf_url = None
-    for a in soup.find_all('a', href=True):
-        href = a['href']
-        if '.pdf' in href.lower() or 'download' in href.lower():
-            pdf_url = urljoin(paper_url, href)
-            break
+    for href in PDF_HREF_XPATH(tree):
+        pdf_url = urljoin(paper_url, href)
 
     # Extract emails from page text
-    page_text = soup.get_text()
+    page_text = tree.text_content()
     emails_on_page = extract_emails_from_text(page_text)
 
+    return {'paper_url': paper_url, 'title': paper_title, 'pdf_url': pdf_url,
+            'authors': authors, 'emails': emails_on_page}
+
+
+def paper_rows(page, year, pdf_authors=None):
+    """CSV rows for one scraped paper page; ``pdf_authors`` is the PDF fallback's result, if it ran."""
+    authors = page['authors']
+    emails_on_page = page['emails']
+
+    # Fields shared by every row of this paper; each branch only fills in email and name
+    base = {
+        'site': SITE_NAME,
+        'year': year,
+        'conference': 'Semantic Web Journal',
+        'track': f'Volume {year}',
+        'paper_url': page['paper_url'],
+        'pdf_url': page['pdf_url'] or '',
+        'affiliation': '',
+    }
+
     # If we have emails on page, match them with authors
     if emails_on_page:
+        rows = []
         for i, email in enumerate(emails_on_page):
             name = ''
             if i < len(authors):
                 name = authors[i]['name']
             elif authors:
                 name = authors[0]['name']
+            rows.append((email, name))
+
+    # If no emails on page but the PDF fallback found some, use those
+    elif pdf_authors:
+        rows = []
+        for i, pdf_auth in enumerate(pdf_authors):
+            name = pdf_auth['name']
+            if not name and i < len(authors):
+                name = authors[i]['name']
+            rows.append((pdf_auth['email'], name))
 
-            results.append({
-                'site': SITE_NAME,
-                'year': year,
-                'conference': 'Semantic Web Journal',
-                'track': f'Volume {year}',
-                'paper_url': paper_url,
-                'pdf_url': pdf_url or '',
-                'email': email,
-                'name': name,
-                'affiliation': ''
-            })
+    # No emails found anywhere - record author names if available
+    elif authors:
+        rows = [('', author['name']) for author in authors]
 
-    # If no emails on page but we have PDF, try extracting from PDF
-    elif pdf_url:
-        if PDFMINER_AVAILABLE:
-            pdf_authors = extract_emails_from_pdf_pdfminer(pdf_url, session)
-        elif PYPDF2_AVAILABLE:
-            pdf_authors = extract_emails_from_pdf_pypdf2(pdf_url, session)
-        else:
-            pdf_authors = []
-
-        if pdf_authors:
-            for i, pdf_auth in enumerate(pdf_authors):
-                name = pdf_auth['name']
-                if not name and i < len(authors):
-                    name = authors[i]['name']
-
-                results.append({
-                    'site': SITE_NAME,
-                    'year': year,
-                    'conference': 'Semantic Web Journal',
-                    'track': f'Volume {year}',
-                    'paper_url': paper_url,
-                    'pdf_url': pdf_url,
-                    'email': pdf_auth['email'],
-                    'name': name,
-                    'affiliation': ''
-                })
-        else:
-            # No emails found anywhere - record paper with author names only
-            if authors:
-                for author in authors:
-                    results.append({
-                        'site': SITE_NAME,
-                        'year': year,
-                        'conference': 'Semantic Web Journal',
-                        'track': f'Volume {year}',
-                        'paper_url': paper_url,
-                        'pdf_url': pdf_url or '',
-                        'email': '',
-                        'name': author['name'],
-                        'affiliation': ''
-                    })
-            else:
-                # Record paper without any author info
-                results.append({
-                    'site': SITE_NAME,
-                    'year': year,
-                    'conference': 'Semantic Web Journal',
-                    'track': f'Volume {year}',
-                    'paper_url': paper_url,
-                    'pdf_url': pdf_url or '',
-                    'email': '',
-                    'name': '',
-                    'affiliation': ''
-                })
+    # Record a paper with a PDF even without any author info
+    elif page['pdf_url']:
+        rows = [('', '')]
     else:
-        # No emails and no PDF - record author names if available
-        if authors:
-            for author in authors:
-                results.append({
-                    'site': SITE_NAME,
-                    'year': year,
-                    'conference': 'Semantic Web Journal',
-                    'track': f'Volume {year}',
-                    'paper_url': paper_url,
-                    'pdf_url': '',
-                    'email': '',
-                    'name': author['name'],
-                    'affiliation': ''
-                })
-
-    return results
-
-
-def write_csv_header():
-    """Write CSV header if file doesn't exist."""
-    if not os.path.exists(OUTPUT_CSV):
-        with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['site', 'year', 'conference', 'track', 'paper_url',
-                             'pdf_url', 'email', 'name', 'affiliation'])
-
+        rows = []
 
-def append_results(results):
-    """Append results to CSV file."""
-    with open(OUTPUT_CSV, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        for r in results:
-            writer.writerow([
-                r['site'], r['year'], r['conference'], r['track'],
-                r['paper_url'], r['pdf_url'], r['email'], r['name'], r['affiliation']
-            ])
+    return [{**base, 'email': email, 'name': name} for email, name in rows]
 
 
 def main():
@@ -396,7 +636,7 @@ def main():
     print("Semantic Web Journal Scraper")
     print("=" * 60)
     print(
-        f"PDF extraction available: pdfminer={PDFMINER_AVAILABLE}, PyPDF2={PYPDF2_AVAILABLE if not PDFMINER_AVAILABLE else 'N/A'}")
+        f"PDF extraction available: PDFium={PDFIUM_AVAILABLE}, pdfminer={PDFMINER_AVAILABLE}, PyPDF2={PYPDF2_AVAILABLE if not PDFMINER_AVAILABLE else 'N/A'}")
     print()
 
     # Clear old results
@@ -404,43 +644,50 @@ def main():
         os.remove(OUTPUT_CSV)
         print(f"Cleared previous {OUTPUT_CSV}")
 
-    write_csv_header()
-    session = make_session()
-
-    # Discover all years
-    years = discover_year_issues(session, max_years=MAX_YEARS)
-
-    if not years:
-        print("No years found!")
-        return
-
-    print(f"\nStarting to scrape {len(years)} years...")
-
-    total_emails = 0
-
-    try:
-        for idx, year_info in enumerate(years, 1):
-            print(f"\n[{idx}/{len(years)}]")
-            results = scrape_year_papers(session, year_info, max_papers=MAX_PAPERS_PER_YEAR)
-
-            if results:
-                append_results(results)
-                emails_found = len([r for r in results if r['email']])
-                total_emails += emails_found
-                print(f"  Saved {emails_found} emails from {year_info['year']}")
-
-            jitter_sleep()
-
-    except KeyboardInterrupt:
-        print("\n\nKeyboardInterrupt - Stopping gracefully...")
-        print(f"Partial results saved to: {OUTPUT_CSV}")
-        return
-
-    print("\n" + "=" * 60)
-    print("SCRAPING COMPLETE")
-    print("=" * 60)
-    print(f"Total emails extracted: {total_emails}")
-    print(f"Results saved to: {os.path.abspath(OUTPUT_CSV)}")
+    # One handle for the whole run; each year's rows go out in a single writerows()
+    with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+
+        session = make_session()
+
+        # Discover all years
+        years = discover_year_issues(session, max_years=MAX_YEARS)
+
+        if not years:
+            print("No years found!")
+            return
+
+        print(f"\nStarting to scrape {len(years)} years...")
+
+        total_emails = 0
+        pdf_pool = ThreadPoolExecutor(max_workers=PDF_WORKERS)
+
+        try:
+            for idx, year_info in enumerate(years, 1):
+                print(f"\n[{idx}/{len(years)}]")
+                results = scrape_year_papers(session, year_info, pdf_pool, max_papers=MAX_PAPERS_PER_YEAR)
+
+                if results:
+                    writer.writerows(results)
+                    f.flush()  # keep partial results on disk
+                    emails_found = len([r for r in results if r['email']])
+                    total_emails += emails_found
+                    print(f"  Saved {emails_found} emails from {year_info['year']}")
+
+        except KeyboardInterrupt:
+            print("\n\nKeyboardInterrupt - Stopping gracefully...")
+            print(f"Partial results saved to: {OUTPUT_CSV}")
+            return
+        finally:
+            # Don't start queued PDF jobs after an interrupt
+            pdf_pool.shutdown(wait=False, cancel_futures=True)
+
+        print("\n" + "=" * 60)
+        print("SCRAPING COMPLETE")
+        print("=" * 60)
+        print(f"Total emails extracted: {total_emails}")
+        print(f"Results saved to: {os.path.abspath(OUTPUT_CSV)}")
 
 
 if __name__ == "__main__":